@@ -5,6 +5,7 @@ import argparse
 import asyncio
 from pathlib import Path
 
+from src.config import setup_event_loop
 from src.printerConnector import CassiniClient
 
 
@@ -39,6 +40,7 @@ async def _run() -> None:
 
 
 def main() -> None:
+    setup_event_loop()
     asyncio.run(_run())
 
 
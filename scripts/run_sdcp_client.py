@@ -11,7 +11,7 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from src.config import load_config
+from src.config import load_config, setup_event_loop
 from src.printerConnector.sdcp_client import SdcpClient
 
 
@@ -41,6 +41,7 @@ def main() -> None:
         finally:
             await client.close()
 
+    setup_event_loop()
     asyncio.run(run())
 
 
@@ -5,7 +5,7 @@
 __version__ = "0.1.0"
 
 from src.bot import main
-from src.config import Config, load_config, setup_logging
+from src.config import Config, load_config, setup_event_loop, setup_logging
 from src.security import SecurityManager, UserWhitelist, RateLimiter
 
 __all__ = [
@@ -13,6 +13,7 @@ __all__ = [
     "Config",
     "load_config",
     "setup_logging",
+    "setup_event_loop",
     "SecurityManager",
     "UserWhitelist",
     "RateLimiter",
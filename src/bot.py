@@ -2,16 +2,20 @@
 Telegram bot entrypoint. Run with: python -m src.bot
 Requires TELEGRAM_BOT_TOKEN in environment (e.g. from .env).
 """
-import json
+import asyncio
 import logging
 from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
 
+import orjson
 from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters
 
-from src.config import load_config, setup_logging
-from src.downloads.fetcher import fetch_model_files
+from src.config import load_config, setup_event_loop, setup_logging
+from src.downloads.fetcher import fetch_model_files, reuse_cached_model_files
 from src.intent.parser import IntentParser
+from src.llm import close_shared_client
 from src.security import SecurityManager
 from src.slicer import OrcaSlicer
 
@@ -24,193 +28,318 @@ config = load_config()
 
 # Constants
 DEFAULT_SUPPORTED_SITES = "Printables and Thingiverse"
+SUPPORTED_DOMAINS_PATH = Path(__file__).resolve().parent.parent / "config" / "supported_domains.json"
 DEFAULT_MATERIAL = "PLA"
 DEFAULT_COLOR = "black"
 DEFAULT_PRICE = "free"
 DEFAULT_QUEUE_POSITION = 1
+# Messages processed in parallel across chats; lets Ollama batch intent requests instead of
+# serving them one by one, while bounding concurrent LLM calls, downloads and slicer runs
+MAX_CONCURRENT_MESSAGES = 8
+
+# Handlers only check and queue messages, so updates are dispatched one at a time and the
+# processing itself is bounded here (asyncio primitives bind to the loop on first use)
+_processing_slots = asyncio.Semaphore(MAX_CONCURRENT_MESSAGES)
+
+# Intent parses currently running, keyed by message text; identical messages share one LLM call
+_inflight_parses: dict[str, asyncio.Task] = {}
 
 # Global security manager
 security_manager = SecurityManager()
 
 
 def _supported_sites_message() -> str:
-    """Load supported domains and return a human-readable list for messages."""
-    path = Path(__file__).resolve().parent.parent / "config" / "supported_domains.json"
+    """Load supported domains and return a human-readable list for messages.
+
+    Called once at import; use SUPPORTED_SITES_MESSAGE on the message path.
+    """
+    path = SUPPORTED_DOMAINS_PATH
     if not path.exists():
         logger.warning("supported_domains.json not found, using default sites")
         return DEFAULT_SUPPORTED_SITES
     try:
-        domains = json.loads(path.read_text(encoding="utf-8"))
+        domains = orjson.loads(path.read_bytes())
         if not domains:
             return DEFAULT_SUPPORTED_SITES
         # "printables.com" -> "Printables", "thingiverse.com" -> "Thingiverse"
         names = [d.split(".")[0].capitalize() for d in domains if isinstance(d, str) and "." in d]
         return " and ".join(names) if names else DEFAULT_SUPPORTED_SITES
     except Exception as e:
-        logger.error(f"Failed to load supported domains: {e}")
+        logger.error("Failed to load supported domains: %s", e)
         return DEFAULT_SUPPORTED_SITES
 
 
+# Supported domains are static config; build the reply text once per process
+SUPPORTED_SITES_MESSAGE = _supported_sites_message()
+
+# Static reply text, built once; only the user's name is filled in per message
+_START_TAIL = (
+    f"Send me a link to Printables and I'll print it for you. \n "
+    f"Current material is {DEFAULT_MATERIAL}. \n Color: {DEFAULT_COLOR}. \n "
+    f"Price: {DEFAULT_PRICE}. \nShipping: next time you see Jacek. "
+    f"Position in queue: {DEFAULT_QUEUE_POSITION}."
+)
+UNCLEAR_REPLY = (
+    "I'm sorry, I didn't quite get that. I can only 3D print from "
+    f"{SUPPORTED_SITES_MESSAGE}. Send me a link and I'll let you know if I can print it.\n"
+    f"Current settings:\nmaterial {DEFAULT_MATERIAL},\ncolor {DEFAULT_COLOR}.\n"
+    f"Price: {DEFAULT_PRICE}.\nShipping: next time you see Jacek.\n"
+    f"Position in queue: {DEFAULT_QUEUE_POSITION}."
+)
+
+
 def _log_user(update: Update, what: str) -> None:
+    # Skip the attribute lookups entirely when INFO is filtered out (e.g. LOG_LEVEL=WARNING)
+    if not logger.isEnabledFor(logging.INFO):
+        return
     user = update.effective_user
     name = user.username or user.first_name or "?"
-    logger.info("user message | user_id=%s @%s | %s", user.id, name, what)
+    # extra= exposes the fields to structured handlers; the default formatter uses the message
+    logger.info(
+        "user message | user_id=%s @%s | %s",
+        user.id,
+        name,
+        what,
+        extra={"user_id": user.id, "username": name, "user_text": what},
+    )
+
+
+async def _parse_intent(text: str, parser: IntentParser) -> dict[str, Any]:
+    """Parse intent, coalescing identical messages that arrive while a parse is in flight."""
+    key = text.strip()
+    task = _inflight_parses.get(key)
+    if task is None:
+        task = asyncio.create_task(parser.parse(text))
+        _inflight_parses[key] = task
+        task.add_done_callback(lambda _: _inflight_parses.pop(key, None))
+    # shield: one cancelled handler must not cancel the parse for the others
+    result = await asyncio.shield(task)
+    return dict(result)
+
+
+async def _slice_stl_files(stl_paths: list[Path], output_dir: Path) -> list[Path]:
+    """Slice downloaded STL files into output_dir."""
+    slicer = OrcaSlicer()
+    return await slicer.slice_files(stl_paths, output_dir)
 
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     _log_user(update, "/start")
     name = update.effective_user.first_name or update.effective_user.username or "there"
     await update.message.reply_text(
-        f"Hi {name}! I'm Your3DPrintingBot — your 3D printing assistant. "
-        f"Send me a link to Printables and I'll print it for you. \n "
-        f"Current material is {DEFAULT_MATERIAL}. \n Color: {DEFAULT_COLOR}. \n "
-        f"Price: {DEFAULT_PRICE}. \nShipping: next time you see Jacek. "
-        f"Position in queue: {DEFAULT_QUEUE_POSITION}."
+        f"Hi {name}! I'm Your3DPrintingBot — your 3D printing assistant. " + _START_TAIL
     )
 
 
 async def handle_user_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Parse user intent and reply based on parsed result."""
+    """Check the message, then queue it behind earlier ones from the same chat and return.
+
+    Chats are handled in parallel; messages within one chat are answered in order.
+    """
     text = update.message.text or ""
     user_id = update.effective_user.id
     _log_user(update, text)
 
-    # Security checks
+    # Security checks (incl. rate limiting) run before queueing, so rejected messages never hold a task
     is_allowed, error_msg = security_manager.check_security(user_id, text)
     if not is_allowed:
-        logger.warning(f"Security check failed for user_id={user_id}: {error_msg}")
+        logger.warning("Security check failed for user_id=%s: %s", user_id, error_msg)
         await update.message.reply_text(f"Access denied: {error_msg}")
         return
 
-    async with IntentParser() as parser:
-        try:
-            intent = await parser.parse(text)
-            logger.info("intent parsed: %s", intent)
-            if intent["intent"] == "unclear":
-                sites = _supported_sites_message()
+    lock = context.chat_data.setdefault("message_lock", asyncio.Lock())
+    context.application.create_task(_handle_in_chat_order(lock, update, context), update=update)
+
+
+async def _handle_in_chat_order(
+    lock: asyncio.Lock, update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    # asyncio.Lock wakes waiters in FIFO order, so arrival order is preserved.
+    # Take the chat lock first: a chat's queued messages must not hold slots other chats could use.
+    async with lock:
+        async with _processing_slots:
+            await _process_user_message(update, context)
+
+
+async def _process_user_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Parse user intent and reply based on parsed result (security checks already passed)."""
+    text = update.message.text or ""
+    user_id = update.effective_user.id
+
+    # Shared parser (one LLM HTTP client for all messages), created in _post_init
+    parser: IntentParser = context.bot_data["intent_parser"]
+
+    try:
+        # Greetings and bare links are answered by the parser without an LLM call
+        intent = await _parse_intent(text, parser)
+        logger.info("intent parsed: %s", intent)
+        if intent["intent"] == "unclear":
+            await update.message.reply_text(UNCLEAR_REPLY)
+        elif intent.get("error"):
+            await update.message.reply_text(
+                f"I understood: intent={intent['intent']}, confidence={intent['confidence']:.2f}. "
+                f"Note: {intent['error']}"
+            )
+        elif intent["intent"] == "print":
+            # User wants to print - download files
+            url = intent.get("url")
+            site = intent.get("site")
+            if not url:
                 await update.message.reply_text(
-                    "I'm sorry, I didn't quite get that. I can only 3D print from "
-                    f"{sites}. Send me a link and I'll let you know if I can print it.\n"
-                    f"Current settings:\nmaterial {DEFAULT_MATERIAL},\ncolor {DEFAULT_COLOR}.\n"
-                    f"Price: {DEFAULT_PRICE}.\nShipping: next time you see Jacek.\n"
-                    f"Position in queue: {DEFAULT_QUEUE_POSITION}."
+                    "I understand you want to print something, but I couldn't find a valid link. "
+                    "Please send me a link from Printables or Thingiverse."
                 )
-            elif intent.get("error"):
+            else:
                 await update.message.reply_text(
-                    f"I understood: intent={intent['intent']}, confidence={intent['confidence']:.2f}. "
-                    f"Note: {intent['error']}"
+                    f"Got it! Downloading files from {site or 'the link'}... ⏳"
                 )
-            elif intent["intent"] == "print":
-                # User wants to print - download files
-                url = intent.get("url")
-                site = intent.get("site")
-                if not url:
-                    await update.message.reply_text(
-                        "I understand you want to print something, but I couldn't find a valid link. "
-                        "Please send me a link from Printables or Thingiverse."
-                    )
-                else:
-                    await update.message.reply_text(
-                        f"Got it! Downloading files from {site or 'the link'}... ⏳"
-                    )
-                    try:
+                try:
+                    # Cache index and file links live on disk; handle them off the event loop
+                    cached = await asyncio.to_thread(reuse_cached_model_files, url, user_id)
+                    if cached:
+                        job_id, stl_paths = cached
+                        cached_tag = " (cached)"
+                    else:
                         job_id, stl_paths = await fetch_model_files(url, user_id=user_id)
-                        if stl_paths:
-                            file_list = "\n".join([f"  • {p.name}" for p in stl_paths[:5]])
-                            if len(stl_paths) > 5:
-                                file_list += f"\n  ... and {len(stl_paths) - 5} more"
-                            output_dir = stl_paths[0].parent
+                        cached_tag = ""
+                    if stl_paths:
+                        file_list = "\n".join([f"  • {p.name}" for p in stl_paths[:5]])
+                        if len(stl_paths) > 5:
+                            file_list += f"\n  ... and {len(stl_paths) - 5} more"
+                        output_dir = stl_paths[0].parent
+                        # Start slicing now so it overlaps with the Telegram reply round-trip
+                        slice_task = asyncio.create_task(_slice_stl_files(stl_paths, output_dir))
+                        try:
                             await update.message.reply_text(
-                                f"✅ Downloaded {len(stl_paths)} file(s) for printing!\n"
+                                f"✅ Downloaded {len(stl_paths)} file(s) for printing!{cached_tag}\n"
                                 f"Job ID: {job_id}\n\n"
                                 f"Files:\n{file_list}\n\n"
                                 f"Material: {intent.get('material', 'PLA')}, Color: {intent.get('color', 'printer_default')}\n"
                                 f"Position in queue: {DEFAULT_QUEUE_POSITION}\n\n"
                             )
-                            try:
-                                slicer = OrcaSlicer()
-                                gcode_paths = await slicer.slice_files(stl_paths, output_dir)
-                                gcode_list = "\n".join([f"  • {p.name}" for p in gcode_paths[:5]])
-                                if len(gcode_paths) > 5:
-                                    gcode_list += f"\n  ... and {len(gcode_paths) - 5} more"
-                                await update.message.reply_text(
-                                    f"✅ Sliced {len(gcode_paths)} file(s)!\n"
-                                    f"G-code files:\n{gcode_list}"
-                                )
-                            except Exception as e:
-                                logger.exception("Slicing failed")
-                                await update.message.reply_text(
-                                    f"❌ Slicing failed: {e}"
-                                )
-                                return
-
-                            await update.message.reply_text("⏳ Uploading G-code to the printer...")
-                            #todo
-                        else:
+                        except BaseException:
+                            # Nobody will report on the slice; stop it and retrieve its outcome
+                            slice_task.cancel()
+                            await asyncio.gather(slice_task, return_exceptions=True)
+                            raise
+                        try:
+                            gcode_paths = await slice_task
+                            gcode_list = "\n".join([f"  • {p.name}" for p in gcode_paths[:5]])
+                            if len(gcode_paths) > 5:
+                                gcode_list += f"\n  ... and {len(gcode_paths) - 5} more"
                             await update.message.reply_text(
-                                f"⚠️ No STL files found at {url}. Please check the link and try again."
+                                f"✅ Sliced {len(gcode_paths)} file(s)!\n"
+                                f"G-code files:\n{gcode_list}"
                             )
-                    except NotImplementedError:
-                        await update.message.reply_text(
-                            f"Sorry, downloading from {site} is not yet supported. "
-                            "Currently only Printables.com is supported."
-                        )
-                    except Exception as e:
-                        logger.exception(f"Failed to download files from {url}")
+                        except Exception as e:
+                            logger.exception("Slicing failed")
+                            await update.message.reply_text(
+                                f"❌ Slicing failed: {e}"
+                            )
+                            return
+
+                        await update.message.reply_text("⏳ Uploading G-code to the printer...")
+                        #todo
+                    else:
                         await update.message.reply_text(
-                            f"❌ Failed to download files: {str(e)}\n\n"
-                            "Please check the link and try again."
+                            f"⚠️ No STL files found at {url}. Please check the link and try again."
                         )
-            elif intent["intent"] == "save":
-                # User wants to save for later
-                url = intent.get("url")
-                site = intent.get("site") or "the link"
-                if url:
-                    await update.message.reply_text(
-                        f"📌 Noted! I've saved this {site} model for later.\n"
-                        f"Link: {url}\n\n"
-                        "(Note: Bookmark feature is not fully implemented yet - "
-                        "this is just a confirmation message)"
-                    )
-                else:
+                except NotImplementedError:
                     await update.message.reply_text(
-                        "I understand you want to save something, but I couldn't find a link. "
-                        "Please send me a link to save."
+                        f"Sorry, downloading from {site} is not yet supported. "
+                        "Currently only Printables.com is supported."
                     )
-            elif intent["intent"] == "info":
-                # User wants information
-                url = intent.get("url")
-                site = intent.get("site") or "the link"
-                if url:
+                except Exception as e:
+                    logger.exception("Failed to download files from %s", url)
                     await update.message.reply_text(
-                        f"ℹ️ Information about this {site} model:\n"
-                        f"Link: {url}\n\n"
-                        "(Note: Detailed model info fetching is not fully implemented yet - "
-                        "you can visit the link to see details)"
-                    )
-                else:
-                    await update.message.reply_text(
-                        "I understand you want information, but I couldn't find what you're asking about. "
-                        "Please send me a link to a model."
+                        f"❌ Failed to download files: {str(e)}\n\n"
+                        "Please check the link and try again."
                     )
+        elif intent["intent"] == "save":
+            # User wants to save for later
+            url = intent.get("url")
+            site = intent.get("site") or "the link"
+            if url:
+                await update.message.reply_text(
+                    f"📌 Noted! I've saved this {site} model for later.\n"
+                    f"Link: {url}\n\n"
+                    "(Note: Bookmark feature is not fully implemented yet - "
+                    "this is just a confirmation message)"
+                )
+            else:
+                await update.message.reply_text(
+                    "I understand you want to save something, but I couldn't find a link. "
+                    "Please send me a link to save."
+                )
+        elif intent["intent"] == "info":
+            # User wants information
+            url = intent.get("url")
+            site = intent.get("site") or "the link"
+            if url:
+                await update.message.reply_text(
+                    f"ℹ️ Information about this {site} model:\n"
+                    f"Link: {url}\n\n"
+                    "(Note: Detailed model info fetching is not fully implemented yet - "
+                    "you can visit the link to see details)"
+                )
             else:
-                # Fallback for any other intent
                 await update.message.reply_text(
-                    f"Intent detected: {intent['intent']} (confidence: {intent['confidence']:.2f})\n"
-                    f"Site: {intent.get('site') or '—'}, URL: {intent.get('url') or '—'}"
+                    "I understand you want information, but I couldn't find what you're asking about. "
+                    "Please send me a link to a model."
                 )
-        except Exception as e:
-            logger.exception("Intent parsing failed")
-            await update.message.reply_text(f"Something went wrong while parsing your message: {e}")
+        else:
+            # Fallback for any other intent
+            await update.message.reply_text(
+                f"Intent detected: {intent['intent']} (confidence: {intent['confidence']:.2f})\n"
+                f"Site: {intent.get('site') or '—'}, URL: {intent.get('url') or '—'}"
+            )
+    except Exception as e:
+        logger.exception("Intent parsing failed")
+        await update.message.reply_text(f"Something went wrong while parsing your message: {e}")
+
+
+async def _post_init(app: Application) -> None:
+    """Create the intent parser shared by all handlers."""
+    # No Telegram warm-up call needed: Application.initialize() has already run bot.get_me()
+    # on the request pool used for replies, so its connection is open before the first update
+    app.bot_data["intent_parser"] = IntentParser()
+
+
+async def _post_shutdown(app: Application) -> None:
+    """Close the shared intent parser and the LLM HTTP client."""
+    parser = app.bot_data.pop("intent_parser", None)
+    if parser is not None:
+        await parser.close()
+    await close_shared_client()
 
 
 def main() -> None:
     logger.info("Starting Your3DPrintingBot...")
-    app = Application.builder().token(config.telegram_bot_token).build()
+    setup_event_loop()
+    app = (
+        Application.builder()
+        .token(config.telegram_bot_token)
+        .post_init(_post_init)
+        .post_shutdown(_post_shutdown)
+        .build()
+    )
     app.add_handler(CommandHandler("start", start))
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_user_message))
-    logger.info("Bot configured, starting polling...")
-    app.run_polling(allowed_updates=Update.ALL_TYPES)
+    if config.webhook_url:
+        # Telegram pushes updates to us: no poll round-trips, no API calls while idle
+        logger.info("Bot configured, starting webhook on port %s...", config.webhook_port)
+        app.run_webhook(
+            listen=config.webhook_listen,
+            port=config.webhook_port,
+            # Serve on the same path as the public URL so a plain reverse proxy can forward as-is
+            url_path=urlparse(config.webhook_url).path.lstrip("/"),
+            secret_token=config.webhook_secret_token,
+            webhook_url=config.webhook_url,
+            allowed_updates=Update.ALL_TYPES,
+        )
+    else:
+        logger.info("Bot configured, starting polling...")
+        app.run_polling(allowed_updates=Update.ALL_TYPES)
 
 
 if __name__ == "__main__":
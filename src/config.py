@@ -1,7 +1,9 @@
 """Centralized configuration and logging setup."""
+import asyncio
 import logging
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +14,8 @@ from dotenv import load_dotenv
 DEFAULT_LOG_LEVEL = "INFO"
 DEFAULT_LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 DEFAULT_LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+DEFAULT_WEBHOOK_LISTEN = "0.0.0.0"
+DEFAULT_WEBHOOK_PORT = 8443
 
 
 def setup_logging(level: str | None = None, format_str: str | None = None) -> None:
@@ -36,6 +40,17 @@ def setup_logging(level: str | None = None, format_str: str | None = None) -> No
     logger.info(f"Logging configured: level={log_level}")
 
 
+def setup_event_loop() -> None:
+    """Use uvloop as the asyncio event loop if it is installed (optional dependency)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logging.getLogger(__name__).info("Using uvloop event loop")
+
+
 class Config:
     """Application configuration with validation."""
 
@@ -59,6 +74,12 @@ class Config:
         # Optional printer settings
         self.printer_ip = os.getenv("PRINTER_IP")
         
+        # Optional webhook settings (long polling is used when WEBHOOK_URL is not set)
+        self.webhook_url = os.getenv("WEBHOOK_URL")
+        self.webhook_listen = os.getenv("WEBHOOK_LISTEN", DEFAULT_WEBHOOK_LISTEN)
+        self.webhook_port = int(os.getenv("WEBHOOK_PORT", DEFAULT_WEBHOOK_PORT))
+        self.webhook_secret_token = os.getenv("WEBHOOK_SECRET_TOKEN")
+
         # Logging
         self.log_level = os.getenv("LOG_LEVEL", DEFAULT_LOG_LEVEL).upper()
 
@@ -95,6 +116,12 @@ class Config:
         if not self.ollama_base_url.startswith("http"):
             warnings.append(f"OLLAMA_BASE_URL should start with http:// or https://: {self.ollama_base_url}")
 
+        # Telegram only delivers webhooks over HTTPS
+        if self.webhook_url and not self.webhook_url.startswith("https://"):
+            warnings.append(f"WEBHOOK_URL must start with https://: {self.webhook_url}")
+        if self.webhook_url and not self.webhook_secret_token:
+            warnings.append("WEBHOOK_SECRET_TOKEN not set - webhook requests are not authenticated")
+
         # Warn if no user whitelist is configured
         if not self.allowed_user_ids:
             warnings.append("No ALLOWED_USER_IDS configured - bot is accessible to all users")
@@ -108,12 +135,17 @@ class Config:
             f"ollama_base_url={self.ollama_base_url}, "
             f"ollama_model={self.ollama_model}, "
             f"allowed_users={len(self.allowed_user_ids)}, "
-            f"printer_ip={self.printer_ip or 'not set'})"
+            f"printer_ip={self.printer_ip or 'not set'}, "
+            f"webhook_url={self.webhook_url or 'not set (polling)'})"
         )
 
 
+@lru_cache(maxsize=1)
 def load_config() -> Config:
-    """Load and validate configuration."""
+    """Load and validate configuration.
+
+    Runs once per process; later calls return the same Config, so treat it as read-only.
+    """
     config = Config()
     
     logger = logging.getLogger(__name__)
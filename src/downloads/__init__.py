@@ -4,10 +4,14 @@ from src.downloads.fetcher import (
     fetch_model_files,
     fetch_printables_stl_list,
     fetch_and_save_printables,
+    get_cached_model_files,
+    reuse_cached_model_files,
 )
 
 __all__ = [
     "fetch_model_files",
     "fetch_printables_stl_list",
     "fetch_and_save_printables",
+    "get_cached_model_files",
+    "reuse_cached_model_files",
 ]
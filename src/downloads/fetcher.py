@@ -2,17 +2,28 @@
 Fetch STL files from a model URL (Printables, Thingiverse), optionally from zip.
 Saves files under a unique job_id directory for downstream processing (e.g. slicer).
 """
+import asyncio
 import json
 import logging
+import os
 import re
+import shutil
+import tempfile
+import threading
+import time
 import zipfile
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 import uuid
 
 import httpx
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, counters are only safe within one process
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
@@ -23,12 +34,49 @@ DEFAULT_JOBS_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "job
 DEFAULT_STL_FILENAME = "file.stl"
 HTTP_TIMEOUT_SHORT = 30.0
 HTTP_TIMEOUT_LONG = 60.0
+DOWNLOAD_CHUNK_SIZE = 1 << 16  # 64 KiB
+DOWNLOAD_WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB gathered per worker-thread write
+ZIP_COPY_CHUNK_SIZE = 1 << 20  # 1 MiB per read when extracting zip entries
+MAX_CONCURRENT_DOWNLOADS = 4  # parallel STL downloads per model, to stay polite to the server
+# Sockets per client; with HTTP/2 the parallel downloads share one connection per host
+HTTP_LIMITS = httpx.Limits(
+    max_connections=MAX_CONCURRENT_DOWNLOADS,
+    max_keepalive_connections=MAX_CONCURRENT_DOWNLOADS,
+)
+STLS_JSON_MAX_LENGTH = 20000  # chars of page scanned for the embedded stls array
 USER_AGENT = "Your3DPrintingBot/1.0 (3D print job fetcher)"
+URL_CACHE_FILENAME = ".url_cache.json"
+JOB_COUNTERS_DIRNAME = ".counters"  # per user/day files holding the last job increment
+MODEL_CACHE_MAX_AGE = 48 * 3600  # seconds before a cached download is fetched again
+STL_LIST_CACHE_TTL = 300.0  # seconds a parsed Printables file list is reused
+STL_LIST_CACHE_MAX_ENTRIES = 256
+
+_JSON_DECODER = json.JSONDecoder()
+_MODEL_ID_RE = re.compile(r"printables\.com/model/(\d+)", re.IGNORECASE)
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+_UNESCAPE_RE = re.compile(r'\\(["/])')  # \" -> " and \/ -> / in one pass
+# Exact hosts per site; other subdomains are matched by suffix, look-alikes are not
+_PRINTABLES_HOSTS = frozenset({"printables.com", "www.printables.com"})
+_THINGIVERSE_HOSTS = frozenset({"thingiverse.com", "www.thingiverse.com"})
+
+# model_id -> (monotonic expiry, STL list); see fetch_printables_stl_list
+_stl_list_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+# model_id -> page fetch currently running; concurrent requests for one model share it
+_inflight_stl_lists: dict[str, asyncio.Task] = {}
+# (expiry timestamp, yyyy.mm.dd) for the job ID date prefix; see _today_str
+_today_cache: tuple[float, str] = (0.0, "")
+# Serializes read-modify-write of the URL cache index across worker threads
+_url_cache_lock = threading.Lock()
+
+
+def _host_in(host: str, hosts: frozenset[str]) -> bool:
+    """True if host is one of hosts or a subdomain of one (never e.g. printables.com.evil.tld)."""
+    return host in hosts or any(host.endswith("." + h) for h in hosts)
 
 
 def _model_id_from_printables_url(url: str) -> str | None:
     """Extract Printables model id from URL like .../model/285921-... or .../model/285921/files."""
-    m = re.search(r"printables\.com/model/(\d+)", url, re.IGNORECASE)
+    m = _MODEL_ID_RE.search(url)
     return m.group(1) if m else None
 
 
@@ -42,22 +90,14 @@ def _parse_printables_stls_from_html(html: str) -> list[dict[str, Any]]:
     start = html.find("[", idx)
     if start == -1:
         return []
-    depth = 0
-    for i in range(start, min(start + 20000, len(html))):
-        c = html[i]
-        if c == "[":
-            depth += 1
-        elif c == "]":
-            depth -= 1
-            if depth == 0:
-                raw = html[start : i + 1]
-                raw = raw.replace('\\"', '"').replace('\\/', "/")
-                try:
-                    return json.loads(raw)
-                except json.JSONDecodeError:
-                    return []
-                break
-    return []
+    raw = html[start : start + STLS_JSON_MAX_LENGTH]
+    raw = _UNESCAPE_RE.sub(r"\1", raw)
+    try:
+        # raw_decode parses the array and ignores whatever page content follows it
+        stls, _ = _JSON_DECODER.raw_decode(raw)
+    except json.JSONDecodeError:
+        return []
+    return stls if isinstance(stls, list) else []
 
 
 def _printables_stl_download_url(file_preview_path: str, file_name: str) -> str:
@@ -76,30 +116,113 @@ def _printables_stl_download_url(file_preview_path: str, file_name: str) -> str:
     return f"{FILES_PRINTABLES_BASE}/{dir_part}/{server_name}"
 
 
-async def fetch_printables_stl_list(model_id: str) -> list[dict[str, Any]]:
-    """Fetch Printables /files page and return list of STL file info (name, filePreviewPath, etc.)."""
+async def _request_printables_stl_list(model_id: str, client: httpx.AsyncClient) -> list[dict[str, Any]]:
+    """Download and parse the Printables /files page for model_id (no caching)."""
     url = PRINTABLES_FILES_PAGE.format(model_id=model_id)
-    async with httpx.AsyncClient(follow_redirects=True, timeout=HTTP_TIMEOUT_SHORT) as client:
-        response = await client.get(
-            url,
-            headers={"User-Agent": USER_AGENT},
-        )
-        response.raise_for_status()
+    response = await client.get(
+        url,
+        headers={"User-Agent": USER_AGENT},
+        timeout=HTTP_TIMEOUT_SHORT,
+    )
+    response.raise_for_status()
     stls = _parse_printables_stls_from_html(response.text)
     return [s for s in stls if (s.get("name") or "").lower().endswith(".stl")]
 
 
-async def download_file(client: httpx.AsyncClient, url: str, dest: Path) -> None:
-    """Download a single file to dest."""
-    response = await client.get(url)
-    response.raise_for_status()
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    dest.write_bytes(response.content)
+async def fetch_printables_stl_list(model_id: str) -> list[dict[str, Any]]:
+    """Fetch Printables /files page and return list of STL file info (name, filePreviewPath, etc.).
+
+    Non-empty results are cached in memory for STL_LIST_CACHE_TTL seconds, and concurrent
+    requests for the same model share one page fetch.
+    """
+    now = time.monotonic()
+    cached = _stl_list_cache.get(model_id)
+    if cached is not None:
+        expires_at, stls = cached
+        if expires_at > now:
+            return list(stls)
+        del _stl_list_cache[model_id]
+
+    task = _inflight_stl_lists.get(model_id)
+    if task is None:
+        # Own client, not a caller's: a cancelled caller closing its client must not break the others
+        task = asyncio.create_task(_fetch_with_own_client(model_id))
+        _inflight_stl_lists[model_id] = task
+        task.add_done_callback(lambda done: _finish_stl_list_fetch(model_id, done))
+    # shield: one cancelled caller must not cancel the fetch for the others
+    stls = await asyncio.shield(task)
+    return list(stls)
+
+
+async def _fetch_with_own_client(model_id: str) -> list[dict[str, Any]]:
+    """Fetch the files page on a client of its own.
+
+    The page is served by www.printables.com and the STLs by files.printables.com, so the
+    download client could not reuse this connection anyway.
+    """
+    async with httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        timeout=HTTP_TIMEOUT_SHORT,
+        limits=HTTP_LIMITS,
+    ) as client:
+        return await _request_printables_stl_list(model_id, client)
+
+
+def _finish_stl_list_fetch(model_id: str, task: asyncio.Task) -> None:
+    """Drop the in-flight entry and cache a successful, non-empty result."""
+    _inflight_stl_lists.pop(model_id, None)
+    if task.cancelled() or task.exception() is not None or not task.result():
+        return
+    if len(_stl_list_cache) >= STL_LIST_CACHE_MAX_ENTRIES:
+        # Dicts keep insertion order, so the first key is the oldest entry
+        _stl_list_cache.pop(next(iter(_stl_list_cache)))
+    _stl_list_cache[model_id] = (time.monotonic() + STL_LIST_CACHE_TTL, task.result())
+
+
+async def download_file(
+    client: httpx.AsyncClient, url: str, dest: Path, chunk_size: int = DOWNLOAD_CHUNK_SIZE
+) -> None:
+    """Download a single file to dest, streaming it in chunk_size pieces to keep memory flat.
+
+    Disk writes run in a worker thread so a slow disk never stalls the event loop.
+    Chunks are gathered up to DOWNLOAD_WRITE_BUFFER_SIZE first: a thread hop costs
+    tens of microseconds, which per 64 KiB chunk rivals the write itself.
+    """
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        handle = await asyncio.to_thread(dest.open, "wb")
+        try:
+            buffer = bytearray()
+            async for chunk in response.aiter_bytes(chunk_size):
+                buffer += chunk
+                if len(buffer) >= DOWNLOAD_WRITE_BUFFER_SIZE:
+                    await asyncio.to_thread(handle.write, buffer)
+                    buffer.clear()  # safe: the worker's write has finished
+            if buffer:
+                await asyncio.to_thread(handle.write, buffer)
+        finally:
+            await asyncio.to_thread(handle.close)
 
 
 def _safe_filename(name: str) -> str:
     """Sanitize filename for local storage."""
-    return re.sub(r'[<>:"/\\|?*]', "_", name).strip() or DEFAULT_STL_FILENAME
+    return _UNSAFE_FILENAME_RE.sub("_", name).strip() or DEFAULT_STL_FILENAME
+
+
+def _today_str() -> str:
+    """Return today's local date as yyyy.mm.dd; only recomputed once the day rolls over."""
+    global _today_cache
+    now = time.time()
+    expires_at, today = _today_cache
+    if now >= expires_at:
+        local = time.localtime(now)
+        today = time.strftime("%Y.%m.%d", local)
+        # Next local midnight; mktime normalizes day overflow into the next month/year
+        expires_at = time.mktime((local.tm_year, local.tm_mon, local.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+        _today_cache = (expires_at, today)
+    return today
 
 
 def _generate_job_id(user_id: int, jobs_dir: Path | None = None) -> str:
@@ -112,39 +235,65 @@ def _generate_job_id(user_id: int, jobs_dir: Path | None = None) -> str:
     
     Returns:
         Job ID string in format: 2026.02.16-123456-001
+
+    Blocking (file lock); from async code call it via asyncio.to_thread.
     """
     jobs_dir = jobs_dir or DEFAULT_JOBS_DIR
-    today = datetime.now().strftime("%Y.%m.%d")
+    today = _today_str()
     prefix = f"{today}-{user_id}-"
-    
-    # Find existing jobs for this user today
-    if jobs_dir.exists():
-        existing = list(jobs_dir.glob(f"{prefix}*"))
-        if existing:
-            # Extract increment numbers and find max
-            increments = []
-            for job_dir in existing:
-                try:
-                    # Extract the increment part (last component after last dash)
-                    parts = job_dir.name.split("-")
-                    if len(parts) >= 3:
-                        increments.append(int(parts[-1]))
-                except (ValueError, IndexError):
-                    continue
-            next_increment = max(increments) + 1 if increments else 1
+
+    # The counter file replaces a scan of every job directory; flock serializes concurrent callers
+    counters_dir = jobs_dir / JOB_COUNTERS_DIRNAME
+    counters_dir.mkdir(parents=True, exist_ok=True)
+    fd = os.open(counters_dir / f"{today}-{user_id}", os.O_RDWR | os.O_CREAT, 0o644)
+    with os.fdopen(fd, "r+") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)  # released when the file is closed
+        raw = handle.read().strip()
+        if raw.isdigit():
+            last_increment = int(raw)
         else:
-            next_increment = 1
-    else:
-        next_increment = 1
-    
+            # New counter file: continue after any jobs created before counters existed
+            last_increment = _max_job_increment(jobs_dir, prefix)
+            _prune_job_counters(counters_dir, today)
+        next_increment = last_increment + 1
+        handle.seek(0)
+        handle.truncate()
+        handle.write(str(next_increment))
+
     return f"{prefix}{next_increment:03d}"
 
 
+def _prune_job_counters(counters_dir: Path, today: str) -> None:
+    """Delete counter files of past days; only today's counters can still be incremented."""
+    for counter in counters_dir.iterdir():
+        if not counter.name.startswith(f"{today}-"):
+            try:
+                counter.unlink()
+            except OSError as e:
+                logger.debug("Could not remove old job counter %s: %s", counter, e)
+
+
+def _max_job_increment(jobs_dir: Path, prefix: str) -> int:
+    """Return the highest increment among existing job directories starting with prefix (0 if none)."""
+    increments = []
+    for job_dir in jobs_dir.glob(f"{prefix}*"):
+        try:
+            # Extract the increment part (last component after last dash)
+            parts = job_dir.name.split("-")
+            if len(parts) >= 3:
+                increments.append(int(parts[-1]))
+        except (ValueError, IndexError):
+            continue
+    return max(increments, default=0)
+
+
 async def fetch_and_save_printables(
     model_url: str,
     user_id: int | None = None,
     job_id: str | None = None,
     jobs_dir: Path | None = None,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
 ) -> tuple[str, list[Path]]:
     """
     Fetch all STL files for a Printables model URL and save under a job directory.
@@ -154,21 +303,12 @@ async def fetch_and_save_printables(
         user_id: Telegram user ID (required for structured job IDs)
         job_id: Optional explicit job ID (if not provided, generates structured ID)
         jobs_dir: Optional jobs directory path
+        chunk_size: Bytes read from the network per write when streaming files to disk
 
     Returns:
         (job_id, list of paths to saved .stl files)
     """
     jobs_dir = jobs_dir or DEFAULT_JOBS_DIR
-    
-    if job_id is None:
-        if user_id is None:
-            # Fallback to UUID if no user_id provided
-            job_id = str(uuid.uuid4())
-        else:
-            job_id = _generate_job_id(user_id, jobs_dir)
-    
-    job_dir = jobs_dir / job_id
-    job_dir.mkdir(parents=True, exist_ok=True)
 
     model_id = _model_id_from_printables_url(model_url)
     if not model_id:
@@ -178,8 +318,25 @@ async def fetch_and_save_printables(
     if not stl_list:
         raise ValueError(f"No STL files found for Printables model {model_id}")
 
-    saved_stls: list[Path] = []
-    async with httpx.AsyncClient(follow_redirects=True, timeout=HTTP_TIMEOUT_LONG) as client:
+    # Allocate the job only once there is something to download: no empty job dirs or burnt IDs
+    if job_id is None:
+        if user_id is None:
+            # Fallback to UUID if no user_id provided
+            job_id = str(uuid.uuid4())
+        else:
+            job_id = await asyncio.to_thread(_generate_job_id, user_id, jobs_dir)
+
+    job_dir = jobs_dir / job_id
+    await asyncio.to_thread(job_dir.mkdir, parents=True, exist_ok=True)
+
+    # One client for every download: all files come from one host, so its connection is reused
+    async with httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        timeout=HTTP_TIMEOUT_LONG,
+        limits=HTTP_LIMITS,
+    ) as client:
+        downloads: list[tuple[str, str, Path]] = []
         for info in stl_list:
             name = info.get("name") or DEFAULT_STL_FILENAME
             preview_path = info.get("filePreviewPath") or ""
@@ -187,29 +344,214 @@ async def fetch_and_save_printables(
             if not url:
                 logger.warning("Skipping STL with no URL: %s", name)
                 continue
-            safe_name = _safe_filename(name)
-            dest = job_dir / safe_name
-            try:
-                await download_file(client, url, dest)
-                saved_stls.append(dest)
-                logger.info("Downloaded %s -> %s", name, dest)
-            except httpx.HTTPError as e:
-                logger.warning("Failed to download %s: %s", url, e)
+            dest = job_dir / _safe_filename(name)
+            if any(dest == queued for _, _, queued in downloads):
+                # Two entries sanitizing to one filename would race on the same file
+                logger.warning("Skipping duplicate STL name: %s", name)
+                continue
+            downloads.append((name, url, dest))
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+
+        async def _download(client: httpx.AsyncClient, url: str, dest: Path) -> None:
+            async with semaphore:
+                await download_file(client, url, dest, chunk_size)
+
+        results = await asyncio.gather(
+            *(_download(client, url, dest) for _, url, dest in downloads),
+            return_exceptions=True,
+        )
+
+    saved_stls: list[Path] = []
+    for (name, url, dest), result in zip(downloads, results):
+        if isinstance(result, httpx.HTTPError):
+            logger.warning("Failed to download %s: %s", url, result)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            saved_stls.append(dest)
+            logger.info("Downloaded %s -> %s", name, dest)
 
     return job_id, saved_stls
 
 
+def _model_cache_key(model_url: str) -> str:
+    """Normalize a model URL so equivalent links share one cache entry."""
+    model_id = _model_id_from_printables_url(model_url)
+    if model_id:
+        return f"printables:{model_id}"
+    parsed = urlparse(model_url)
+    netloc = (parsed.netloc or "").lower()
+    if netloc.startswith("www."):
+        netloc = netloc[4:]
+    return f"{netloc}{parsed.path.rstrip('/')}"
+
+
+def _load_url_cache(jobs_dir: Path) -> dict[str, Any]:
+    """Load the URL -> job index, returning an empty index if missing or corrupt."""
+    path = jobs_dir / URL_CACHE_FILENAME
+    if not path.exists():
+        return {}
+    try:
+        index = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning("Ignoring unreadable URL cache %s: %s", path, e)
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _entry_fetched_at(entry: Any) -> float | None:
+    """Return when a URL cache entry was fetched, or None if the entry is malformed."""
+    if not isinstance(entry, dict):
+        return None
+    try:
+        return float(entry["fetched_at"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _remember_model_files(model_url: str, job_id: str, stl_paths: list[Path], jobs_dir: Path) -> None:
+    """Record downloaded files for a model URL so repeat requests can skip the download.
+
+    Expired or malformed entries and entries whose job directory is gone are dropped
+    on the way, so the index stays bounded by the jobs still on disk.
+    Blocking and thread-safe: callers run it via asyncio.to_thread, so writers may overlap.
+    """
+    path = jobs_dir / URL_CACHE_FILENAME
+    now = time.time()
+    # Read-modify-write of the whole index; unserialized writers would drop each other's entries
+    with _url_cache_lock:
+        index = {
+            key: entry
+            for key, entry in _load_url_cache(jobs_dir).items()
+            if (fetched_at := _entry_fetched_at(entry)) is not None
+            and now - fetched_at <= MODEL_CACHE_MAX_AGE
+            and isinstance(entry.get("job_id"), str)
+            and (jobs_dir / entry["job_id"]).is_dir()
+        }
+        index[_model_cache_key(model_url)] = {
+            "job_id": job_id,
+            "files": [p.name for p in stl_paths],
+            "fetched_at": now,
+        }
+        try:
+            jobs_dir.mkdir(parents=True, exist_ok=True)
+            tmp = tempfile.NamedTemporaryFile(
+                dir=jobs_dir, prefix=URL_CACHE_FILENAME, suffix=".tmp", delete=False
+            )
+            tmp_path = Path(tmp.name)
+            try:
+                with tmp:
+                    tmp.write(orjson.dumps(index))
+                tmp_path.replace(path)
+            finally:
+                tmp_path.unlink(missing_ok=True)  # only left behind if the write failed
+        except OSError as e:
+            logger.warning("Failed to update URL cache %s: %s", path, e)
+
+
+def get_cached_model_files(
+    model_url: str,
+    jobs_dir: Path | None = None,
+    max_age: float = MODEL_CACHE_MAX_AGE,
+) -> tuple[str, list[Path]] | None:
+    """
+    Return files from a previous download of the same model URL, if still fresh.
+
+    Args:
+        model_url: URL to the model
+        jobs_dir: Optional jobs directory path
+        max_age: Maximum age in seconds of a cached download
+
+    Returns:
+        (job_id, list of .stl paths) on a cache hit, None otherwise
+    """
+    jobs_dir = jobs_dir or DEFAULT_JOBS_DIR
+    entry = _load_url_cache(jobs_dir).get(_model_cache_key(model_url))
+    fetched_at = _entry_fetched_at(entry)
+    # A corrupt entry is a miss; the next download overwrites it
+    if fetched_at is None or time.time() - fetched_at > max_age:
+        return None
+    job_id = entry.get("job_id")
+    files = entry.get("files") or []
+    if not job_id or not files:
+        return None
+    stl_paths = [jobs_dir / job_id / name for name in files]
+    # Job directories may have been cleaned up since the entry was written
+    if not all(p.exists() for p in stl_paths):
+        return None
+    return job_id, stl_paths
+
+
+def reuse_cached_model_files(
+    model_url: str,
+    user_id: int | None = None,
+    jobs_dir: Path | None = None,
+    max_age: float = MODEL_CACHE_MAX_AGE,
+) -> tuple[str, list[Path]] | None:
+    """
+    Start a new job from a previous download of the same model URL, if still fresh.
+
+    The cached job may belong to another user, so its files are hard-linked (or copied,
+    where linking is not possible) into a job directory of the requester's own.
+    Blocking; from async code call it via asyncio.to_thread.
+
+    Args:
+        model_url: URL to the model
+        user_id: Telegram user ID (for structured job IDs)
+        jobs_dir: Optional jobs directory path
+        max_age: Maximum age in seconds of a cached download
+
+    Returns:
+        (new job_id, list of .stl paths in the new job directory) on a cache hit, None otherwise
+    """
+    jobs_dir = jobs_dir or DEFAULT_JOBS_DIR
+    cached = get_cached_model_files(model_url, jobs_dir=jobs_dir, max_age=max_age)
+    if cached is None:
+        return None
+    _, cached_paths = cached
+
+    job_id = str(uuid.uuid4()) if user_id is None else _generate_job_id(user_id, jobs_dir)
+    job_dir = jobs_dir / job_id
+    job_dir.mkdir(parents=True, exist_ok=True)
+    stl_paths: list[Path] = []
+    try:
+        for source in cached_paths:
+            target = job_dir / source.name
+            try:
+                os.link(source, target)
+            except OSError:
+                shutil.copy2(source, target)
+            stl_paths.append(target)
+    except OSError as e:
+        # Cached files vanished mid-copy; fall back to a fresh download
+        logger.warning("Failed to reuse cached files for %s: %s", model_url, e)
+        shutil.rmtree(job_dir, ignore_errors=True)
+        return None
+    return job_id, stl_paths
+
+
 def unzip_stls_from_path(zip_path: Path, out_dir: Path) -> list[Path]:
-    """Extract all .stl files from a zip into out_dir. Returns list of extracted .stl paths."""
+    """Extract all .stl files from a zip into out_dir. Returns list of extracted .stl paths.
+
+    Blocking; from async code call it via asyncio.to_thread.
+    """
     out_dir.mkdir(parents=True, exist_ok=True)
     extracted: list[Path] = []
     with zipfile.ZipFile(zip_path, "r") as zf:
-        for name in zf.namelist():
-            if name.lower().endswith(".stl"):
-                safe = _safe_filename(Path(name).name)
-                target = out_dir / safe
-                target.write_bytes(zf.read(name))
-                extracted.append(target)
+        # Directory entries such as "models.stl/" would otherwise become empty files
+        stl_entries = [
+            info for info in zf.infolist()
+            if not info.is_dir() and info.filename.lower().endswith(".stl")
+        ]
+        for info in stl_entries:
+            safe = _safe_filename(Path(info.filename).name)
+            target = out_dir / safe
+            # Stream the entry so a large STL is never held in memory whole
+            with zf.open(info) as src, target.open("wb") as dst:
+                shutil.copyfileobj(src, dst, ZIP_COPY_CHUNK_SIZE)
+            logger.debug("Extracted %s (%d bytes) -> %s", info.filename, info.file_size, target)
+            extracted.append(target)
     return extracted
 
 
@@ -218,6 +560,7 @@ async def fetch_model_files(
     user_id: int | None = None,
     job_id: str | None = None,
     jobs_dir: Path | None = None,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
 ) -> tuple[str, list[Path]]:
     """
     Fetch STL files from a supported model URL (Printables; Thingiverse TBD).
@@ -229,14 +572,21 @@ async def fetch_model_files(
         user_id: Telegram user ID (for structured job IDs)
         job_id: Optional explicit job ID
         jobs_dir: Optional jobs directory path
+        chunk_size: Bytes read from the network per write when streaming files to disk
 
     Returns:
         (job_id, list of paths to .stl files in the job directory)
     """
-    parsed = urlparse(model_url)
-    netloc = (parsed.netloc or "").lower()
-    if "printables.com" in netloc:
-        return await fetch_and_save_printables(model_url, user_id=user_id, job_id=job_id, jobs_dir=jobs_dir)
-    if "thingiverse.com" in netloc:
+    host = urlparse(model_url).hostname or ""
+    if _host_in(host, _PRINTABLES_HOSTS):
+        job_id, stl_paths = await fetch_and_save_printables(
+            model_url, user_id=user_id, job_id=job_id, jobs_dir=jobs_dir, chunk_size=chunk_size
+        )
+        if stl_paths:
+            await asyncio.to_thread(
+                _remember_model_files, model_url, job_id, stl_paths, jobs_dir or DEFAULT_JOBS_DIR
+            )
+        return job_id, stl_paths
+    if _host_in(host, _THINGIVERSE_HOSTS):
         raise NotImplementedError("Thingiverse fetcher not implemented yet")
     raise ValueError(f"Unsupported model URL: {model_url}")
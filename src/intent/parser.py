@@ -1,11 +1,23 @@
 """Intent parser: detects URLs, validates supported sites, uses LLM to extract intent."""
-import json
 import logging
 import re
+import string
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
+import orjson
+
+try:
+    # Optional: RE2 matches in linear time, so untrusted messages cannot trigger backtracking
+    import re2 as url_regex
+except ImportError:
+    url_regex = re
+
 from src.llm.base import LLMProvider
 from src.llm.fallback import FallbackLLMProvider
 from src.llm.ollama import OllamaProvider
@@ -15,32 +27,67 @@ logger = logging.getLogger(__name__)
 # Prompt version for tracking
 PROMPT_VERSION = "1.0"
 
+# Parsed intents are reused for repeated messages; low-confidence answers are not pinned
+INTENT_CACHE_TTL = 3600.0  # seconds
+INTENT_CACHE_MAX_ENTRIES = 1024
+INTENT_CACHE_MIN_CONFIDENCE = 0.5
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_CODE_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*(?:```|$)", re.IGNORECASE | re.DOTALL)
+
+VALID_INTENTS = frozenset({"print", "save", "info", "unclear"})
+
+# Messages classified without an LLM round-trip (see IntentParser._quick_intent)
+GREETINGS = frozenset({"hi", "hello", "hey", "thanks", "thank you", "thx", "ok", "okay"})
+GREETING_MAX_LENGTH = 16
+PRINT_KEYWORDS = frozenset({"print", "print this", "print it", "print please", "please print", "pls print"})
+QUICK_PRINT_CONFIDENCE = 0.9
+MAX_PROMPT_URLS = 8  # detected URLs listed in the LLM prompt; bounds worst-case prompt size
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+# Base for every "unclear" result; copy before filling in url/site/error
+_UNCLEAR_DEFAULTS: dict[str, Any] = {
+    "intent": "unclear",
+    "url": None,
+    "site": None,
+    "confidence": 0.0,
+    "material": "PLA",
+    "color": "printer_default",
+    "error": None,
+}
+
+# Kept byte-identical across calls so the LLM server can reuse its cached prompt prefix
+SYSTEM_PROMPT = "You are a precise JSON-only intent parser. Return only valid JSON."
+
 
 def _config_path(*parts: str) -> Path:
     """Return path under config/ relative to project root."""
     return Path(__file__).resolve().parent.parent.parent / "config" / Path(*parts)
 
 
+@lru_cache(maxsize=1)
 def _load_intent_prompt() -> str:
-    """Load intent parser prompt from config file."""
+    """Load intent parser prompt from config file (read once per process)."""
     path = _config_path("prompts", "intent_parser.txt")
     if not path.exists():
         raise FileNotFoundError(f"Intent prompt file not found: {path}")
     return path.read_text(encoding="utf-8").strip()
 
 
-def load_supported_domains() -> tuple[set[str], list[str]]:
+@lru_cache(maxsize=1)
+def load_supported_domains() -> tuple[frozenset[str], tuple[str, ...]]:
     """
-    Load supported domains from config file.
+    Load supported domains from config file (read once per process).
 
     Returns:
-        Tuple of (set of domain strings for validation, list of base domains for regex).
+        Tuple of (set of domain strings for validation, base domains for regex).
         Domain set includes both 'example.com' and 'www.example.com' for each entry.
+        Both are immutable since the cached value is shared by every caller.
     """
     path = _config_path("supported_domains.json")
     if not path.exists():
         raise FileNotFoundError(f"Supported domains file not found: {path}")
-    raw: list[str] = json.loads(path.read_text(encoding="utf-8"))
+    raw: list[str] = orjson.loads(path.read_bytes())
     if not isinstance(raw, list) or not all(isinstance(d, str) for d in raw):
         raise ValueError("supported_domains.json must be a list of strings")
     domain_set: set[str] = set()
@@ -52,15 +99,62 @@ def load_supported_domains() -> tuple[set[str], list[str]]:
         domain_set.add(d)
         domain_set.add(f"www.{d}")
         base_domains.append(d)
-    return domain_set, base_domains
+    return frozenset(domain_set), tuple(base_domains)
 
 
+@lru_cache(maxsize=1)
 def load_intent_schema() -> dict[str, Any]:
-    """Load intent JSON schema from config file."""
+    """Load intent JSON schema from config file (read once per process; do not mutate the result)."""
     path = _config_path("intent_schema.json")
     if not path.exists():
         raise FileNotFoundError(f"Intent schema file not found: {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
+    return orjson.loads(path.read_bytes())
+
+
+@lru_cache(maxsize=8)
+def _compile_url_pattern(base_domains: tuple[str, ...]):
+    """Build URL regex from base domains (e.g. printables\\.com|thingiverse\\.com); compiled once per list.
+
+    Uses RE2 when installed; the inline (?i) flag works with both engines.
+    """
+    # Longest first: when one domain is a prefix of another (example.co / example.com), the
+    # backtracking engine tries the full one first and the captured group is the real host
+    ordered = sorted(base_domains, key=lambda d: (-len(d), d))
+    domain_alternation = "|".join(re.escape(d) for d in ordered)
+    return url_regex.compile(rf"(?i)https?://(?:www\.)?({domain_alternation})[^\s]*")
+
+
+def _compile_prompt_template(template: str) -> Callable[[str, str], str]:
+    """
+    Pre-split the prompt template around {user_message} and {urls}.
+
+    Returns a render(user_message, urls) function that only concatenates strings, so the
+    template is not re-parsed by str.format on every call. Templates with other fields,
+    format specs or conversions fall back to str.format.
+    """
+    segments: list[str] = []
+    fields: list[str] = []
+    literal = ""
+    simple = True
+    try:
+        # Formatter.parse already turns {{ and }} into literal braces
+        for text, field, spec, conversion in string.Formatter().parse(template):
+            literal += text
+            if field is not None:
+                simple = simple and not spec and conversion is None
+                segments.append(literal)
+                fields.append(field)
+                literal = ""
+    except ValueError:
+        simple = False
+    segments.append(literal)
+
+    if not simple or sorted(fields) != ["urls", "user_message"]:
+        return lambda user_message, urls: template.format(user_message=user_message, urls=urls)
+    head, middle, tail = segments
+    if fields[0] == "user_message":
+        return lambda user_message, urls: head + user_message + middle + urls + tail
+    return lambda user_message, urls: head + urls + middle + user_message + tail
 
 
 class IntentParser:
@@ -70,7 +164,8 @@ class IntentParser:
         self,
         llm_provider: LLMProvider | None = None,
         prompt_template: str | None = None,
-        supported_domains: tuple[set[str], list[str]] | None = None,
+        supported_domains: tuple[frozenset[str], tuple[str, ...]] | None = None,
+        allow_heuristic_bypass: bool = True,
     ):
         """
         Initialize intent parser.
@@ -79,19 +174,21 @@ class IntentParser:
             llm_provider: LLM provider instance (defaults to OllamaProvider)
             prompt_template: Override prompt template (defaults to config/prompts/intent_parser.txt)
             supported_domains: Override (domain_set, base_domains) (defaults to config/supported_domains.json)
+            allow_heuristic_bypass: Answer greetings and bare supported links without calling the LLM
         """
         self.llm = llm_provider or OllamaProvider()
         self._owns_llm = llm_provider is None  # Track if we created the LLM provider
         self._prompt_template = prompt_template if prompt_template is not None else _load_intent_prompt()
+        self._render_prompt = _compile_prompt_template(self._prompt_template)
+        self.allow_heuristic_bypass = allow_heuristic_bypass
         domain_set, base_domains = supported_domains if supported_domains is not None else load_supported_domains()
         self._supported_domains = domain_set
         self._base_domains = base_domains
-        # Build URL regex from base domains (e.g. printables\.com|thingiverse\.com)
-        domain_alternation = "|".join(re.escape(d) for d in base_domains)
-        self.url_pattern = re.compile(
-            rf"https?://(?:www\.)?({domain_alternation})[^\s]*",
-            re.IGNORECASE,
-        )
+        self.url_pattern = _compile_url_pattern(tuple(base_domains))
+        # Base domain captured by url_pattern -> site name (e.g. printables.com -> printables)
+        self._domain_to_site = {d: d.split(".", 1)[0] for d in base_domains}
+        # (normalized message, validated URLs) -> (monotonic expiry, intent result), oldest first
+        self._result_cache: OrderedDict[tuple[str, tuple[str, ...]], tuple[float, dict[str, Any]]] = OrderedDict()
 
     def extract_urls(self, text: str) -> list[str]:
         """
@@ -103,11 +200,29 @@ class IntentParser:
         Returns:
             List of detected URLs
         """
-        # Extract full URLs directly from matches
-        urls = []
+        return [url for url, _ in self._scan_urls(text)]
+
+    def _scan_urls(self, text: str) -> list[tuple[str, str | None]]:
+        """
+        Extract supported-domain URLs and their site in one pass over the text.
+
+        Returns:
+            List of (url, site) pairs; site is None for URLs that fail validation
+        """
+        results = []
         for match in self.url_pattern.finditer(text):
-            urls.append(match.group(0))
-        return urls
+            url = match.group(0)
+            domain_end = match.end(1)
+            # Host ends right after the captured domain: validate from the match, no urlparse.
+            # Anything else (port, userinfo, printables.com.evil.tld) takes the full check.
+            if domain_end == match.end() or text[domain_end] in "/?#":
+                host = text[match.start() : domain_end].split("://", 1)[1].lower()
+                if host in self._supported_domains:
+                    results.append((url, self._domain_to_site[match.group(1).lower()]))
+                    continue
+            _, site = self.validate_url(url)
+            results.append((url, site))
+        return results
 
     def validate_url(self, url: str) -> tuple[bool, str | None]:
         """
@@ -128,30 +243,30 @@ class IntentParser:
                 return True, site
             return False, None
         except Exception as e:
-            logger.warning(f"URL validation error for {url}: {e}")
+            logger.warning("URL validation error for %s: %s", url, e)
             return False, None
 
-    def _validate_urls(self, urls: list[str]) -> tuple[list[str], list[str], str | None, str | None]:
+    def _validate_urls(
+        self, scanned: list[tuple[str, str | None]]
+    ) -> tuple[list[str], list[str], str | None, str | None]:
         """
-        Validate URLs and return validated URLs, errors, and primary URL/site.
+        Split scanned (url, site) pairs into validated URLs and errors, and pick the primary URL/site.
 
         Returns:
             Tuple of (validated_urls, errors, primary_url, primary_site)
         """
         validated_urls = []
         errors = []
-        for url in urls:
-            is_valid, _ = self.validate_url(url)
-            if is_valid:
+        primary_site = None
+        for url, site in scanned:
+            if site is not None:
+                if not validated_urls:
+                    primary_site = site
                 validated_urls.append(url)
             else:
                 errors.append(f"Unsupported or invalid URL: {url}")
 
         primary_url = validated_urls[0] if validated_urls else None
-        primary_site = None
-        if primary_url:
-            _, primary_site = self.validate_url(primary_url)
-
         return validated_urls, errors, primary_url, primary_site
 
     def _create_error_intent(
@@ -159,15 +274,9 @@ class IntentParser:
     ) -> dict[str, Any]:
         """Create an error intent response."""
         error_text = error_msg if error_msg else ("; ".join(errors) if errors else None)
-        return {
-            "intent": "unclear",
-            "url": url,
-            "site": site,
-            "confidence": 0.0,
-            "material": "PLA",
-            "color": "printer_default",
-            "error": error_text,
-        }
+        result = _UNCLEAR_DEFAULTS.copy()
+        result.update(url=url, site=site, error=error_text)
+        return result
 
     def _merge_errors(self, result: dict[str, Any], validation_errors: list[str]) -> dict[str, Any]:
         """Merge validation errors into result."""
@@ -177,14 +286,15 @@ class IntentParser:
             result["error"] = result["error"] + "; " + "; ".join(validation_errors)
         return result
 
-    async def _call_llm(self, user_message: str, urls_str: str) -> str:
-        """Call LLM with user message and URLs, with fallback on failure."""
-        prompt = self._prompt_template.format(
-            user_message=user_message,
-            urls=urls_str,
-        )
+    async def _call_llm(self, user_message: str, urls_str: str) -> tuple[str, bool]:
+        """Call LLM with user message and URLs, with fallback on failure.
+
+        Returns:
+            Tuple of (response text, True if the rule-based fallback answered)
+        """
+        prompt = self._render_prompt(user_message, urls_str)
         messages = [
-            {"role": "system", "content": "You are a precise JSON-only intent parser. Return only valid JSON."},
+            {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": prompt},
         ]
         logger.info(
@@ -195,27 +305,27 @@ class IntentParser:
         try:
             response = await self.llm.chat(messages, temperature=0.1)
             logger.info("LLM response received (length=%d)", len(response))
-            return response
+            return response, False
         except Exception as e:
-            logger.warning(f"Primary LLM failed: {e}, using fallback")
+            logger.warning("Primary LLM failed: %s, using fallback", e)
             # Use fallback LLM
             fallback = FallbackLLMProvider()
             response = await fallback.chat(messages)
             logger.info("Fallback LLM response received (length=%d)", len(response))
-            return response
-        return response
+            return response, True
 
     def _parse_llm_response(self, response: str) -> dict[str, Any]:
         """Parse and clean LLM JSON response."""
         response = response.strip()
-        # Remove markdown code blocks if present
-        if "```json" in response:
-            response = response.split("```json")[1].split("```")[0].strip()
-        elif "```" in response:
-            response = response.split("```")[1].split("```")[0].strip()
-        # Some LLMs emit \\/ or \\. in URLs (escaped unnecessarily); normalize
-        response = response.replace(r"\/", "/").replace(r"\.", ".")
-        return json.loads(response)
+        # Remove markdown code blocks if present (```json, ```JSON or bare ```; closing fence optional)
+        fence = _CODE_FENCE_RE.search(response)
+        if fence:
+            response = fence.group(1)
+        # Some LLMs emit \\/ or \\. in URLs (escaped unnecessarily). \\/ is a valid JSON escape that
+        # orjson decodes itself; \\. is not, so only that one is rewritten, and only when present
+        if r"\." in response:
+            response = response.replace(r"\.", ".")
+        return orjson.loads(response)
 
     def _build_intent_result(
         self, intent_data: dict[str, Any], primary_url: str | None, primary_site: str | None
@@ -232,13 +342,63 @@ class IntentParser:
         }
 
         # Validate intent enum
-        if result["intent"] not in ["print", "save", "info", "unclear"]:
+        if result["intent"] not in VALID_INTENTS:
             result["intent"] = "unclear"
             result["confidence"] = 0.0
             result["error"] = "Invalid intent value from LLM"
 
         return result
 
+    def _get_cached_result(self, key: tuple[str, tuple[str, ...]]) -> dict[str, Any] | None:
+        """Return a copy of a cached, unexpired intent result for key, or None."""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return dict(result)
+
+    def _cache_result(self, key: tuple[str, tuple[str, ...]], result: dict[str, Any]) -> None:
+        """Cache a confident LLM result, evicting the least recently used entry when full."""
+        if result["intent"] == "unclear" or result["confidence"] < INTENT_CACHE_MIN_CONFIDENCE:
+            return
+        self._result_cache[key] = (time.monotonic() + INTENT_CACHE_TTL, dict(result))
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > INTENT_CACHE_MAX_ENTRIES:
+            self._result_cache.popitem(last=False)
+
+    def _quick_intent(
+        self, normalized: str, user_message: str, scanned: list[tuple[str, str | None]]
+    ) -> dict[str, Any] | None:
+        """
+        Classify unambiguous messages without calling the LLM.
+
+        Handles short greetings (unclear) and a single supported link, alone or with a
+        bare "print" request around it (print).
+
+        Returns:
+            Intent dict, or None if the message needs the LLM
+        """
+        if not scanned:
+            if len(normalized) < GREETING_MAX_LENGTH and normalized.rstrip("!.?") in GREETINGS:
+                result = _UNCLEAR_DEFAULTS.copy()
+                result["confidence"] = 1.0
+                return result
+            return None
+
+        if len(scanned) != 1 or scanned[0][1] is None:
+            return None
+        url, site = scanned[0]
+        rest = _NON_WORD_RE.sub(" ", user_message.replace(url, " ")).strip().lower()
+        if rest and rest not in PRINT_KEYWORDS:
+            return None
+        result = _UNCLEAR_DEFAULTS.copy()
+        result.update(intent="print", url=url, site=site, confidence=QUICK_PRINT_CONFIDENCE)
+        return result
+
     async def parse(self, user_message: str) -> dict[str, Any]:
         """
         Parse user intent from message.
@@ -250,37 +410,58 @@ class IntentParser:
             Intent dict matching the schema in config/intent_schema.json
         """
         # Extract and validate URLs
-        urls = self.extract_urls(user_message)
-        urls_str = ", ".join(urls) if urls else "None"
-        validated_urls, errors, primary_url, primary_site = self._validate_urls(urls)
+        # Order-preserving dedup: a pasted-twice link should not grow the prompt
+        scanned = list(dict.fromkeys(self._scan_urls(user_message)))
+        urls = [url for url, _ in scanned]
+        if len(urls) > MAX_PROMPT_URLS:
+            urls_str = ", ".join(urls[:MAX_PROMPT_URLS]) + ", ..."
+        else:
+            urls_str = ", ".join(urls) if urls else "None"
+        validated_urls, errors, primary_url, primary_site = self._validate_urls(scanned)
 
         # If we have URLs but none are valid, return error early
         if urls and not validated_urls:
             return self._create_error_intent(urls[0] if urls else None, None, errors)
 
+        normalized = _WHITESPACE_RE.sub(" ", user_message.strip().lower())
+        if self.allow_heuristic_bypass:
+            quick = self._quick_intent(normalized, user_message, scanned)
+            if quick is not None:
+                logger.info("Intent resolved without LLM: %s", quick["intent"])
+                return quick
+
+        cache_key = (normalized, tuple(sorted(validated_urls)))
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            logger.info("Intent cache hit")
+            return cached
+
         try:
             # Call LLM and parse response
-            response = await self._call_llm(user_message, urls_str)
+            response, from_fallback = await self._call_llm(user_message, urls_str)
             intent_data = self._parse_llm_response(response)
 
             # Build and validate result
             result = self._build_intent_result(intent_data, primary_url, primary_site)
 
             # Merge validation errors if any
-            return self._merge_errors(result, errors)
+            result = self._merge_errors(result, errors)
+            if not from_fallback:
+                self._cache_result(cache_key, result)
+            return result
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM JSON response: {e}\\nResponse: {response}")
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse LLM JSON response: %s\nResponse: %s", e, response)
             return self._create_error_intent(
                 primary_url, primary_site, errors, f"Failed to parse LLM response as JSON: {e}"
             )
         except Exception as e:
-            logger.error(f"Intent parsing error: {e}")
+            logger.error("Intent parsing error: %s", e)
             return self._create_error_intent(primary_url, primary_site, errors, f"Intent parsing failed: {e}")
 
     async def close(self) -> None:
         """Close resources (LLM provider if owned)."""
-        if self._owns_llm and hasattr(self.llm, "close"):
+        if self._owns_llm:
             await self.llm.close()
 
     async def __aenter__(self):
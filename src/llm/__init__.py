@@ -2,10 +2,11 @@
 
 from src.llm.base import LLMProvider
 from src.llm.fallback import FallbackLLMProvider
-from src.llm.ollama import OllamaProvider
+from src.llm.ollama import OllamaProvider, close_shared_client
 
 __all__ = [
     "LLMProvider",
     "OllamaProvider",
     "FallbackLLMProvider",
+    "close_shared_client",
 ]
@@ -5,6 +5,8 @@ from abc import ABC, abstractmethod
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    __slots__ = ()  # lets subclasses that declare __slots__ skip the per-instance __dict__
+
     @abstractmethod
     async def chat(self, messages: list[dict[str, str]], **kwargs) -> str:
         """
@@ -19,3 +21,6 @@ class LLMProvider(ABC):
             Generated text response from the LLM
         """
         pass
+
+    async def close(self) -> None:
+        """Release provider resources (HTTP clients etc.). No-op by default."""
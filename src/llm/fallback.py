@@ -3,10 +3,27 @@ import logging
 import re
 from typing import Any
 
+import orjson
+
+try:
+    # Optional: RE2 matches in linear time, so untrusted messages cannot trigger backtracking
+    import re2 as url_regex
+except ImportError:
+    url_regex = re
+
 from src.llm.base import LLMProvider
 
 logger = logging.getLogger(__name__)
 
+# Keyword groups in priority order; matched as substrings like the original `in` checks
+_INTENT_KEYWORDS_RE = re.compile(
+    r"(?P<print>print|make|create)|(?P<save>save|bookmark|later)|(?P<info>what|info|tell|show|details)",
+    re.IGNORECASE,
+)
+_INTENT_PRIORITY = ("print", "save", "info")
+_URL_RE = url_regex.compile(r"https?://[^\s]+")
+_SITE_RE = re.compile(r"(printables|thingiverse)\.com", re.IGNORECASE)
+
 
 class FallbackLLMProvider(LLMProvider):
     """Simple rule-based fallback when LLM is unavailable."""
@@ -30,22 +47,16 @@ class FallbackLLMProvider(LLMProvider):
                 break
 
         # Extract URLs using simple regex
-        url_pattern = r"https?://[^\s]+"
-        urls = re.findall(url_pattern, user_message)
+        urls = _URL_RE.findall(user_message)
         
-        # Determine intent based on simple keywords
-        message_lower = user_message.lower()
+        # Determine intent based on simple keywords (one scan; highest-priority group wins)
+        found = {match.lastgroup for match in _INTENT_KEYWORDS_RE.finditer(user_message)}
+        keyword_intent = next((name for name in _INTENT_PRIORITY if name in found), None)
         intent = "unclear"
         confidence = 0.5
         
-        if any(word in message_lower for word in ["print", "make", "create"]):
-            intent = "print"
-            confidence = 0.7
-        elif any(word in message_lower for word in ["save", "bookmark", "later"]):
-            intent = "save"
-            confidence = 0.7
-        elif any(word in message_lower for word in ["what", "info", "tell", "show", "details"]):
-            intent = "info"
+        if keyword_intent:
+            intent = keyword_intent
             confidence = 0.7
         elif urls:
             # If there's a URL but no clear intent keyword, assume print
@@ -56,10 +67,9 @@ class FallbackLLMProvider(LLMProvider):
         site = None
         url = urls[0] if urls else None
         if url:
-            if "printables.com" in url.lower():
-                site = "printables"
-            elif "thingiverse.com" in url.lower():
-                site = "thingiverse"
+            site_match = _SITE_RE.search(url)
+            if site_match:
+                site = site_match.group(1).lower()
         
         # Build JSON response
         result = {
@@ -71,6 +81,4 @@ class FallbackLLMProvider(LLMProvider):
             "color": "printer_default",
             "error": None,
         }
-        
-        import json
-        return json.dumps(result)
+        return orjson.dumps(result).decode()
@@ -1,9 +1,11 @@
 """Ollama LLM provider (localhost default)."""
+import asyncio
 import logging
 import os
 from typing import Any
 
 import httpx
+import orjson
 
 from src.llm.base import LLMProvider
 
@@ -13,16 +15,58 @@ logger = logging.getLogger(__name__)
 DEFAULT_OLLAMA_BASE_URL = "http://localhost:11434"
 DEFAULT_OLLAMA_MODEL = "llama3.2"
 DEFAULT_OLLAMA_TIMEOUT = 30.0
+# How long Ollama keeps the model (and its prompt KV cache) loaded after a request
+DEFAULT_OLLAMA_KEEP_ALIVE = "10m"
+OLLAMA_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=16, keepalive_expiry=60.0)
+
+# One connection pool for every provider instance; see _get_shared_client.
+# Owned by the application: providers never close it, close_shared_client() does on shutdown.
+_shared_client: httpx.AsyncClient | None = None
+_shared_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def _get_shared_client() -> httpx.AsyncClient:
+    """Return the module-wide HTTP client, creating it for the running event loop if needed."""
+    global _shared_client, _shared_client_loop
+    loop = asyncio.get_running_loop()
+    # A client is bound to the loop it was first used on (e.g. separate asyncio.run calls)
+    if _shared_client is None or _shared_client.is_closed or _shared_client_loop is not loop:
+        stale = _shared_client
+        _shared_client = httpx.AsyncClient(
+            http2=True,  # used when Ollama sits behind an HTTPS proxy; plain http stays HTTP/1.1
+            timeout=DEFAULT_OLLAMA_TIMEOUT,
+            limits=OLLAMA_HTTP_LIMITS,
+        )
+        _shared_client_loop = loop
+        if stale is not None and not stale.is_closed:
+            try:
+                await stale.aclose()
+            except Exception as e:  # its connections may belong to a loop that is already closed
+                logger.debug("Error closing HTTP client from a previous event loop: %s", e)
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared Ollama HTTP client (call once on application shutdown)."""
+    global _shared_client, _shared_client_loop
+    client = _shared_client
+    _shared_client = None
+    _shared_client_loop = None
+    if client is not None:
+        await client.aclose()
 
 
 class OllamaProvider(LLMProvider):
     """Ollama LLM provider for localhost or remote Ollama instance."""
 
+    __slots__ = ("base_url", "model", "timeout", "keep_alive")
+
     def __init__(
         self,
         base_url: str | None = None,
         model: str | None = None,
         timeout: float = DEFAULT_OLLAMA_TIMEOUT,
+        keep_alive: str | None = None,
     ):
         """
         Initialize Ollama provider.
@@ -31,18 +75,12 @@ class OllamaProvider(LLMProvider):
             base_url: Ollama API base URL (default: http://localhost:11434)
             model: Model name to use (default: llama3.2)
             timeout: Request timeout in seconds
+            keep_alive: How long the model stays loaded between requests (default: 10m)
         """
         self.base_url = base_url or os.getenv("OLLAMA_BASE_URL", DEFAULT_OLLAMA_BASE_URL)
         self.model = model or os.getenv("OLLAMA_MODEL", DEFAULT_OLLAMA_MODEL)
         self.timeout = timeout
-        self._client: httpx.AsyncClient | None = None
-
-    @property
-    def client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
-        return self._client
+        self.keep_alive = keep_alive or os.getenv("OLLAMA_KEEP_ALIVE", DEFAULT_OLLAMA_KEEP_ALIVE)
 
     async def chat(self, messages: list[dict[str, str]], **kwargs: Any) -> str:
         """
@@ -61,28 +99,32 @@ class OllamaProvider(LLMProvider):
             "model": self.model,
             "messages": messages,
             "stream": False,
+            # Unloading between messages would drop the cached system/template prefix
+            "keep_alive": self.keep_alive,
             **kwargs,  # Allow passing temperature, top_p, etc.
         }
 
         try:
-            response = await self.client.post(
+            # Shared by all Ollama providers, so kept-alive connections are reused
+            client = await _get_shared_client()
+            response = await client.post(
                 f"{self.base_url}/api/chat",
                 json=payload,
+                timeout=self.timeout,
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             raw_content = data.get("message", {}).get("content", "")
-            logger.info("LLM raw response: %s", raw_content)
+            # Responses can be long; skip the call entirely when INFO is filtered out
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("LLM raw response: %s", raw_content)
             return raw_content
         except httpx.HTTPError as e:
-            logger.error(f"Ollama API error: {e}")
+            logger.error("Ollama API error: %s", e)
             raise RuntimeError(f"Failed to call Ollama: {e}") from e
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+        """Release this provider. No-op: the shared HTTP client is closed by close_shared_client()."""
 
     async def __aenter__(self):
         return self
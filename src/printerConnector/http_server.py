@@ -37,10 +37,21 @@ class HttpFileServer:
     @staticmethod
     def _make_handler(root_dir: Path):
         class Handler(SimpleHTTPRequestHandler):
+            # StreamRequestHandler sets TCP_NODELAY on each accepted socket, so the
+            # response headers are not held back by Nagle waiting for the printer's ACK
+            disable_nagle_algorithm = True
+
             def __init__(self, *args, **kwargs):
                 super().__init__(*args, directory=str(root_dir), **kwargs)
 
             def log_message(self, format, *args):
                 return
 
+            def copyfile(self, source, outputfile):
+                # Headers are already on the wire; let the kernel copy the file straight
+                # to the socket (os.sendfile) instead of reading it through Python.
+                # socket.sendfile falls back to plain send() where sendfile is unavailable.
+                outputfile.flush()
+                self.connection.sendfile(source)
+
         return Handler
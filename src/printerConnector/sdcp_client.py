@@ -2,7 +2,12 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
+import mmap
+import random
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -11,13 +16,18 @@ if str(SDCP_API_PATH) not in sys.path:
     sys.path.append(str(SDCP_API_PATH))
 
 from sdcp_printer import SDCPPrinter  # noqa: E402
-import hashlib
-
 from sdcp_printer.enum import SDCPFrom, SDCPCommand  # noqa: E402
 from sdcp_printer.scanner import discover_devices  # noqa: E402
 from sdcp_printer.request import SDCPRequest  # noqa: E402
 
 _PRINTER_NOT_CONNECTED = "Printer is not connected"
+_HASH_CHUNK_SIZE = 1 << 20  # 1 MiB, for Pythons without hashlib.file_digest
+
+# Reconnect backoff (seconds): random first wait up to INITIAL, then MIN growing by FACTOR up to MAX
+RECONNECT_BACKOFF_INITIAL = 5.0
+RECONNECT_BACKOFF_MIN = 1.92
+RECONNECT_BACKOFF_FACTOR = 1.618
+RECONNECT_BACKOFF_MAX = 60.0
 
 
 class SdcpClient:
@@ -28,6 +38,7 @@ class SdcpClient:
         self.timeout = timeout
         self.printer: Optional[SDCPPrinter] = None
         self._listen_task: Optional[asyncio.Task] = None
+        self._status_refresh: Optional[asyncio.Task] = None
 
     @staticmethod
     def discover(timeout: int = 1):
@@ -49,11 +60,50 @@ class SdcpClient:
         await printer.wait_for_connection_async(timeout=self.timeout)
         return printer
 
+    async def connect_with_backoff(self, max_attempts: Optional[int] = None) -> SDCPPrinter:
+        """
+        Connect, retrying failed attempts with jittered exponential backoff.
+
+        The random first delay keeps several clients from retrying in lockstep after a
+        network blip. Retries forever unless max_attempts is given; the last error is raised.
+        """
+        delay: Optional[float] = None
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await self.connect()
+            except Exception:
+                # Drop the half-open connection and listener, also before giving up
+                with contextlib.suppress(Exception):
+                    await self.close()
+                if max_attempts is not None and attempt >= max_attempts:
+                    raise
+            if delay is None:
+                wait = random.random() * RECONNECT_BACKOFF_INITIAL
+                delay = RECONNECT_BACKOFF_MIN
+            else:
+                wait = delay
+                delay = min(delay * RECONNECT_BACKOFF_FACTOR, RECONNECT_BACKOFF_MAX)
+            await asyncio.sleep(wait)
+
     async def refresh_status(self) -> None:
-        """Request a status update from the printer."""
+        """Request a status update from the printer; concurrent callers share one round-trip."""
         if not self.printer:
             raise RuntimeError(_PRINTER_NOT_CONNECTED)
-        await self.printer.refresh_status_async(timeout=self.timeout, sdcp_from=SDCPFrom.PC)
+        task = self._status_refresh
+        if task is None:
+            task = asyncio.create_task(
+                self.printer.refresh_status_async(timeout=self.timeout, sdcp_from=SDCPFrom.PC)
+            )
+            self._status_refresh = task
+            task.add_done_callback(self._clear_status_refresh)
+        # shield: one cancelled caller must not cancel the refresh for the others
+        await asyncio.shield(task)
+
+    def _clear_status_refresh(self, task: asyncio.Task) -> None:
+        if self._status_refresh is task:
+            self._status_refresh = None
 
     async def request_status(self) -> None:
         """Cmd 0: Request status refresh."""
@@ -107,6 +157,11 @@ class SdcpClient:
             raise RuntimeError(_PRINTER_NOT_CONNECTED)
 
         file_path_obj = Path(file_path)
+        stat = file_path_obj.stat()
+        # Off the event loop; re-uploads of an unchanged file reuse the cached digest
+        md5 = await asyncio.to_thread(
+            self._cached_file_md5, str(file_path_obj.resolve()), stat.st_size, stat.st_mtime_ns
+        )
         payload = SDCPRequest.build(
             self.printer,
             SDCPCommand.UPLOAD_FILE,
@@ -114,9 +169,9 @@ class SdcpClient:
                 "Check": 0,
                 "CleanCache": 1,
                 "Compress": 0,
-                "FileSize": file_path_obj.stat().st_size,
+                "FileSize": stat.st_size,
                 "Filename": file_path_obj.name,
-                "MD5": self._file_md5(file_path_obj),
+                "MD5": md5,
                 "URL": url,
             },
             SDCPFrom.PC,
@@ -194,12 +249,34 @@ class SdcpClient:
             self._listen_task.cancel()
             self._listen_task = None
 
+        if self._status_refresh:
+            self._status_refresh.cancel()
+            self._status_refresh = None
+
         self.printer = None
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _cached_file_md5(resolved_path: str, size: int, mtime_ns: int) -> str:
+        """MD5 memoized per file version; size and mtime in the key invalidate edited files."""
+        return SdcpClient._file_md5(Path(resolved_path))
+
     @staticmethod
     def _file_md5(file_path: Path) -> str:
-        hash_md5 = hashlib.md5()
         with open(file_path, "rb") as handle:
-            for chunk in iter(lambda: handle.read(8192), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            # Map the whole file so MD5 runs as one C call; empty files and odd filesystems can't be mapped
+            try:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if hasattr(mapped, "madvise"):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+                    return hashlib.md5(mapped).hexdigest()
+            except (ValueError, OSError):
+                pass
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+: hashing loop runs in C
+                return hashlib.file_digest(handle, "md5").hexdigest()
+            hash_md5 = hashlib.md5()
+            buffer = bytearray(_HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while size := handle.readinto(buffer):
+                hash_md5.update(view[:size])
+            return hash_md5.hexdigest()
@@ -1,8 +1,9 @@
 """Security features for the bot: rate limiting, input validation, user whitelist."""
 import logging
 import os
+import re
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -12,6 +13,9 @@ MAX_MESSAGE_LENGTH = 2000
 MAX_MESSAGES_PER_MINUTE = 10
 MAX_MESSAGES_PER_HOUR = 100
 
+# Rejected content; one case-insensitive pass instead of lowercasing the message
+_SUSPICIOUS_RE = re.compile(r"<script|javascript:|data:text/html", re.IGNORECASE)
+
 
 class RateLimiter:
     """Rate limiter to prevent abuse."""
@@ -30,8 +34,9 @@ class RateLimiter:
         """
         self.max_per_minute = max_per_minute
         self.max_per_hour = max_per_hour
-        self._minute_counts: dict[int, list[float]] = defaultdict(list)
-        self._hour_counts: dict[int, list[float]] = defaultdict(list)
+        # Accepted-message timestamps per user, oldest first; never more than the limit is kept
+        self._minute_counts: dict[int, deque[float]] = defaultdict(lambda: deque(maxlen=max_per_minute))
+        self._hour_counts: dict[int, deque[float]] = defaultdict(lambda: deque(maxlen=max_per_hour))
 
     def check_rate_limit(self, user_id: int) -> tuple[bool, str | None]:
         """
@@ -43,23 +48,27 @@ class RateLimiter:
         Returns:
             Tuple of (is_allowed, error_message)
         """
-        now = time.time()
+        now = time.monotonic()  # immune to wall-clock adjustments
         minute_ago = now - 60
         hour_ago = now - 3600
+        minute_counts = self._minute_counts[user_id]
+        hour_counts = self._hour_counts[user_id]
 
         # Clean old entries
-        self._minute_counts[user_id] = [t for t in self._minute_counts[user_id] if t > minute_ago]
-        self._hour_counts[user_id] = [t for t in self._hour_counts[user_id] if t > hour_ago]
+        while minute_counts and minute_counts[0] <= minute_ago:
+            minute_counts.popleft()
+        while hour_counts and hour_counts[0] <= hour_ago:
+            hour_counts.popleft()
 
         # Check limits
-        if len(self._minute_counts[user_id]) >= self.max_per_minute:
+        if len(minute_counts) >= self.max_per_minute:
             return False, f"Rate limit exceeded: {self.max_per_minute} messages per minute"
-        if len(self._hour_counts[user_id]) >= self.max_per_hour:
+        if len(hour_counts) >= self.max_per_hour:
             return False, f"Rate limit exceeded: {self.max_per_hour} messages per hour"
 
         # Record this message
-        self._minute_counts[user_id].append(now)
-        self._hour_counts[user_id].append(now)
+        minute_counts.append(now)
+        hour_counts.append(now)
         return True, None
 
 
@@ -129,12 +138,10 @@ def validate_message(message: str) -> tuple[bool, str | None]:
         return False, f"Message too long (max {MAX_MESSAGE_LENGTH} characters)"
 
     # Basic sanitization checks - reject messages with suspicious patterns
-    suspicious_patterns = ["<script", "javascript:", "data:text/html"]
-    message_lower = message.lower()
-    for pattern in suspicious_patterns:
-        if pattern in message_lower:
-            logger.warning(f"Suspicious pattern detected in message: {pattern}")
-            return False, "Message contains suspicious content"
+    match = _SUSPICIOUS_RE.search(message)
+    if match:
+        logger.warning("Suspicious pattern detected in message: %s", match.group(0).lower())
+        return False, "Message contains suspicious content"
 
     return True, None
 
@@ -1,14 +1,24 @@
 """
 Base abstract class for slicer implementations.
 """
+import asyncio
+import logging
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List
+from typing import Any, List
+
+logger = logging.getLogger(__name__)
+
+# Slicers are multithreaded themselves; running a few at once still overlaps their single-threaded phases
+MAX_CONCURRENT_SLICES = max(1, min(4, (os.cpu_count() or 2) // 2))
 
 
 class BaseSlicer(ABC):
     """Abstract base class for 3D printer slicers."""
 
+    max_concurrent_slices: int = MAX_CONCURRENT_SLICES
+
     @abstractmethod
     async def slice_file(self, stl_path: Path, output_dir: Path) -> Path:
         """
@@ -27,20 +37,59 @@ class BaseSlicer(ABC):
         """
         pass
 
-    @abstractmethod
+    async def _batch_slice_kwargs(self) -> dict[str, Any]:
+        """
+        Extra keyword arguments passed to every slice_file call of one slice_files batch.
+
+        Override to do shared setup (e.g. preparing presets) once per batch rather than
+        once per concurrently running file. None by default.
+        """
+        return {}
+
     async def slice_files(self, stl_paths: List[Path], output_dir: Path) -> List[Path]:
         """
-        Slice multiple STL files to G-code.
+        Slice multiple STL files to G-code, up to max_concurrent_slices at a time.
+
+        Implementations must keep concurrent slice_file calls into the same
+        output_dir from overwriting each other's output.
 
         Args:
             stl_paths: List of paths to STL files
             output_dir: Directory where G-code files should be saved
 
         Returns:
-            List of paths to generated G-code files
+            List of paths to generated G-code files, in the order of stl_paths
 
         Raises:
-            FileNotFoundError: If any STL file or preset doesn't exist
-            RuntimeError: If slicing fails
+            RuntimeError: If any slicing operation fails
         """
-        pass
+        logger.info(f"Starting batch slicing of {len(stl_paths)} file(s)...")
+        batch_kwargs = await self._batch_slice_kwargs()
+        semaphore = asyncio.Semaphore(self.max_concurrent_slices)
+
+        async def slice_one(stl_path: Path) -> Path:
+            async with semaphore:
+                return await self.slice_file(stl_path, output_dir, **batch_kwargs)
+
+        results = await asyncio.gather(
+            *(slice_one(stl_path) for stl_path in stl_paths), return_exceptions=True
+        )
+
+        gcode_paths = []
+        errors = []
+        for stl_path, result in zip(stl_paths, results):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result  # CancelledError, KeyboardInterrupt, SystemExit: not a slicing failure
+            if isinstance(result, Exception):
+                logger.error(f"Failed to slice {stl_path.name}: {result}")
+                errors.append((stl_path.name, str(result)))
+            else:
+                gcode_paths.append(result)
+        if errors:
+            error_summary = "\n".join([f"  • {name}: {err}" for name, err in errors])
+            raise RuntimeError(
+                f"Failed to slice {len(errors)}/{len(stl_paths)} file(s):\n{error_summary}"
+            )
+
+        logger.info(f"✅ Successfully sliced {len(gcode_paths)} file(s)")
+        return gcode_paths
@@ -2,19 +2,42 @@
 OrcaSlicer implementation for slicing STL files to G-code.
 """
 import asyncio
+import hashlib
 import json
 import logging
 import os
 import shutil
 import tempfile
+import threading
+import time
 import zipfile
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from src.slicer.base import BaseSlicer
 
 logger = logging.getLogger(__name__)
 
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+GCODE_CACHE_MAX_AGE = 30 * 24 * 3600  # seconds since last use before a cached G-code is dropped
+GCODE_CACHE_MAX_BYTES = 2 << 30  # 2 GiB; least recently used entries go first beyond this
+
+# Normalized presets in .orca_cli_cache are shared by every OrcaSlicer instance (one per job)
+_PRESET_BUILD_LOCK = threading.Lock()
+
+
+def _file_sha256(path: Path) -> bytes:
+    """SHA-256 of a file, streamed without loading it into memory."""
+    with path.open("rb") as handle:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(handle, "sha256").digest()
+        digest = hashlib.sha256()
+        buffer = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while size := handle.readinto(buffer):
+            digest.update(view[:size])
+        return digest.digest()
+
 
 class OrcaSlicer(BaseSlicer):
     """
@@ -43,6 +66,8 @@ class OrcaSlicer(BaseSlicer):
         # We also inject G92 E0 into layer_gcode when relative extrusion is in use.
         self._cli_cache_dir = Path(__file__).resolve().parent.parent.parent / "config" / "printers" / ".orca_cli_cache"
         self._cli_cache_dir.mkdir(exist_ok=True)
+        # Sliced G-code is cached by content hash of the STL and the preset files used to slice it.
+        self._gcode_cache_dir = Path(__file__).resolve().parent.parent.parent / "data" / "gcode_cache"
         
         if not self.orca_bin:
             raise FileNotFoundError(
@@ -182,10 +207,12 @@ class OrcaSlicer(BaseSlicer):
             extract_dir = bundle_path.parent / f".{bundle_path.stem}_extracted"
             extract_dir.mkdir(exist_ok=True)
 
-            with zipfile.ZipFile(bundle_path, "r") as zip_ref:
-                zip_ref.extractall(extract_dir)
-
-            logger.debug(f"Extracted bundle to: {extract_dir}")
+            # Re-extracting rewrites files running slices may be reading; only do it when the bundle changed
+            marker = extract_dir / "bundle_structure.json"
+            if not marker.exists() or marker.stat().st_mtime < bundle_path.stat().st_mtime:
+                with zipfile.ZipFile(bundle_path, "r") as zip_ref:
+                    zip_ref.extractall(extract_dir)
+                logger.debug(f"Extracted bundle to: {extract_dir}")
 
             return self._extract_config_dir(extract_dir)
 
@@ -242,8 +269,7 @@ class OrcaSlicer(BaseSlicer):
         data["type"] = expected_type
         cache_path = self._cli_cache_dir / f"{config_path.stem}.cli.json"
         try:
-            with cache_path.open("w", encoding="utf-8") as handle:
-                json.dump(data, handle, indent=2)
+            self._write_cli_cache(cache_path, data)
             return cache_path
         except Exception as exc:
             logger.warning(f"Failed to write CLI config cache {cache_path}: {exc}")
@@ -262,8 +288,7 @@ class OrcaSlicer(BaseSlicer):
         data["layer_gcode"] = (layer_gcode + "\nG92 E0\n").lstrip()
         cache_path = self._cli_cache_dir / f"{process_config.stem}.g92.cli.json"
         try:
-            with cache_path.open("w", encoding="utf-8") as handle:
-                json.dump(data, handle, indent=2)
+            self._write_cli_cache(cache_path, data)
             return cache_path
         except Exception as exc:
             logger.warning(f"Failed to write CLI process cache {cache_path}: {exc}")
@@ -282,8 +307,7 @@ class OrcaSlicer(BaseSlicer):
         data["layer_gcode"] = (layer_gcode + "\nG92 E0\n").lstrip()
         cache_path = self._cli_cache_dir / f"{machine_config.stem}.g92.cli.json"
         try:
-            with cache_path.open("w", encoding="utf-8") as handle:
-                json.dump(data, handle, indent=2)
+            self._write_cli_cache(cache_path, data)
             return cache_path
         except Exception as exc:
             logger.warning(f"Failed to write CLI machine cache {cache_path}: {exc}")
@@ -311,13 +335,32 @@ class OrcaSlicer(BaseSlicer):
 
         cache_path = self._cli_cache_dir / f"{process_config.stem}.compat.cli.json"
         try:
-            with cache_path.open("w", encoding="utf-8") as handle:
-                json.dump(data, handle, indent=2)
+            self._write_cli_cache(cache_path, data)
             return cache_path
         except Exception as exc:
             logger.warning(f"Failed to write CLI compatibility cache {cache_path}: {exc}")
             return process_config
 
+    def _write_cli_cache(self, cache_path: Path, data: dict) -> None:
+        """Write a normalized preset atomically, leaving an unchanged file alone.
+
+        Running OrcaSlicer processes read these files, so they must never be seen half-written.
+        """
+        content = json.dumps(data, indent=2)
+        try:
+            if cache_path.read_text(encoding="utf-8") == content:
+                return
+        except OSError:
+            pass
+        fd, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=self._cli_cache_dir)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(content)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
     def _gcode_has_g92(self, gcode: str) -> bool:
         return "G92 E0" in gcode.upper()
 
@@ -346,6 +389,24 @@ class OrcaSlicer(BaseSlicer):
         fix_path = Path(__file__).resolve().parent.parent.parent / "config" / "printers" / "fix_layer_gcode.json"
         return fix_path if fix_path.exists() else None
 
+    async def _prepare_preset_args(self) -> List[str]:
+        """Build preset CLI args off the event loop, one builder at a time across instances."""
+
+        def build() -> List[str]:
+            with _PRESET_BUILD_LOCK:
+                return self._build_preset_args()
+
+        preset_args = await asyncio.to_thread(build)
+        if not preset_args and self.preset_path and self.preset_path.exists():
+            logger.info(
+                f"Preset '{self.preset_path.name}' could not be applied via CLI; using OrcaSlicer defaults."
+            )
+        return preset_args
+
+    async def _batch_slice_kwargs(self) -> dict[str, Any]:
+        """Prepare presets once for the whole batch; concurrent slices then only read them."""
+        return {"preset_args": await self._prepare_preset_args()}
+
     def _build_preset_args(self) -> List[str]:
         """Create CLI args for --load-settings/--load-filaments using normalized presets."""
         preset_args: List[str] = []
@@ -451,13 +512,94 @@ class OrcaSlicer(BaseSlicer):
 
         return []
 
-    async def slice_file(self, stl_path: Path, output_dir: Path) -> Path:
+    def _gcode_cache_key(self, stl_path: Path, preset_args: List[str]) -> str:
+        """Hash the STL, the slicer binary and every preset file passed on the command line.
+
+        The binary is identified by path, size and mtime, so an in-place upgrade re-slices.
+        """
+        digest = hashlib.sha256()
+        digest.update(str(self.orca_bin).encode())
+        binary = shutil.which(str(self.orca_bin))
+        if binary:
+            binary_stat = os.stat(binary)
+            digest.update(f"\0{binary_stat.st_size}\0{binary_stat.st_mtime_ns}".encode())
+        digest.update("\0".join(preset_args).encode())
+
+        config_paths = [
+            Path(value)
+            for arg in preset_args
+            if not arg.startswith("--")
+            for value in arg.split(";")
+        ]
+        for path in [stl_path, *config_paths]:
+            if path.is_file():
+                digest.update(_file_sha256(path))
+
+        return digest.hexdigest()
+
+    def _copy_from_gcode_cache(self, cache_key: str, gcode_path: Path) -> bool:
+        """Copy cached G-code to gcode_path. Returns True on a cache hit."""
+        cached = self._gcode_cache_dir / f"{cache_key}.gcode"
+        if not cached.exists():
+            return False
+        try:
+            shutil.copyfile(cached, gcode_path)
+            os.utime(cached)  # mark as recently used for _prune_gcode_cache
+        except OSError as exc:
+            logger.warning(f"Failed to reuse cached G-code {cached}: {exc}")
+            return False
+        return True
+
+    def _store_in_gcode_cache(self, cache_key: str, gcode_path: Path) -> None:
+        """Keep a copy of freshly sliced G-code for identical future requests."""
+        try:
+            self._gcode_cache_dir.mkdir(parents=True, exist_ok=True)
+            # Unique temp name: concurrent slices of the same model may store at the same time
+            fd, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=self._gcode_cache_dir)
+            os.close(fd)
+            tmp_path = Path(tmp_name)
+            try:
+                shutil.copyfile(gcode_path, tmp_path)
+                tmp_path.replace(self._gcode_cache_dir / f"{cache_key}.gcode")
+            finally:
+                tmp_path.unlink(missing_ok=True)
+        except OSError as exc:
+            logger.warning(f"Failed to write G-code cache for {gcode_path.name}: {exc}")
+            return
+        self._prune_gcode_cache()
+
+    def _prune_gcode_cache(self) -> None:
+        """Drop cached G-code unused for GCODE_CACHE_MAX_AGE, then the oldest beyond GCODE_CACHE_MAX_BYTES."""
+        entries = []
+        for path in self._gcode_cache_dir.glob("*.gcode"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort(reverse=True)  # most recently used first
+
+        cutoff = time.time() - GCODE_CACHE_MAX_AGE
+        total = 0
+        for mtime, size, path in entries:
+            if mtime >= cutoff and total + size <= GCODE_CACHE_MAX_BYTES:
+                total += size
+                continue
+            try:
+                path.unlink()
+            except OSError as exc:
+                logger.warning(f"Failed to prune cached G-code {path}: {exc}")
+
+    async def slice_file(
+        self, stl_path: Path, output_dir: Path, preset_args: Optional[List[str]] = None
+    ) -> Path:
         """
         Slice a single STL file to G-code using OrcaSlicer.
 
         Args:
             stl_path: Path to the input STL file
             output_dir: Directory where G-code should be saved
+            preset_args: Preset CLI args prepared by slice_files; built here if None
 
         Returns:
             Path to the generated G-code file
@@ -474,55 +616,61 @@ class OrcaSlicer(BaseSlicer):
         # Output G-code file will have same name as STL but with .gcode extension  
         gcode_path = output_dir / f"{stl_path.stem}.gcode"
         
-        # Build command
-        cmd = [
-            str(self.orca_bin),
-            "--slice", "0",  # 0 = slice all plates
-            "--outputdir", str(output_dir),
-        ]
-        
-        preset_args = self._build_preset_args()
-        if preset_args:
-            cmd.extend(preset_args)
-        elif self.preset_path and self.preset_path.exists():
-            logger.info(
-                f"Preset '{self.preset_path.name}' could not be applied via CLI; using OrcaSlicer defaults."
-            )
-        
-        cmd.append(str(stl_path))
+        if preset_args is None:
+            preset_args = await self._prepare_preset_args()
+
+        # Hashing and copying multi-MB files would stall every chat; keep them off the event loop
+        cache_key = await asyncio.to_thread(self._gcode_cache_key, stl_path, preset_args)
+        if await asyncio.to_thread(self._copy_from_gcode_cache, cache_key, gcode_path):
+            logger.info(f"✅ Reused cached G-code for {stl_path.name} -> {gcode_path.name}")
+            return gcode_path
         
         logger.info(f"Slicing {stl_path.name} with OrcaSlicer...")
-        logger.debug(f"Command: {' '.join(cmd)}")
         
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            
-            stdout, stderr = await process.communicate()
-            
-            # Log output for debugging
-            if stdout:
-                logger.debug(f"OrcaSlicer stdout: {stdout.decode()}")
-            if stderr:
-                logger.debug(f"OrcaSlicer stderr: {stderr.decode()}")
-            
-            if process.returncode != 0:
-                error_msg = stderr.decode() if stderr else stdout.decode() if stdout else "Unknown error"
-                logger.error(f"OrcaSlicer failed with code {process.returncode}: {error_msg}")
-                raise RuntimeError(f"Slicing failed: {error_msg}")
-            
-            if not gcode_path.exists():
-                gcode_files = sorted(output_dir.glob("*.gcode"), key=lambda p: p.stat().st_mtime, reverse=True)
-                if gcode_files:
-                    gcode_path = gcode_files[0]
-                else:
-                    raise RuntimeError(f"G-code file not created: {gcode_path}")
+            # Private output dir per run: concurrent slices (slice_files) can't pick up each other's G-code
+            with tempfile.TemporaryDirectory(prefix=".slice-", dir=output_dir) as work_dir:
+                work_path = Path(work_dir)
+                cmd = [
+                    str(self.orca_bin),
+                    "--slice", "0",  # 0 = slice all plates
+                    "--outputdir", str(work_path),
+                    *preset_args,
+                    str(stl_path),
+                ]
+                logger.debug(f"Command: {' '.join(cmd)}")
+
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                
+                stdout, stderr = await process.communicate()
+                
+                # Log output for debugging
+                if stdout:
+                    logger.debug(f"OrcaSlicer stdout: {stdout.decode()}")
+                if stderr:
+                    logger.debug(f"OrcaSlicer stderr: {stderr.decode()}")
+                
+                if process.returncode != 0:
+                    error_msg = stderr.decode() if stderr else stdout.decode() if stdout else "Unknown error"
+                    logger.error(f"OrcaSlicer failed with code {process.returncode}: {error_msg}")
+                    raise RuntimeError(f"Slicing failed: {error_msg}")
+                
+                # OrcaSlicer may name the output after the plate rather than the STL
+                produced = work_path / gcode_path.name
+                if not produced.exists():
+                    gcode_files = sorted(work_path.glob("*.gcode"), key=lambda p: p.stat().st_mtime, reverse=True)
+                    if not gcode_files:
+                        raise RuntimeError(f"G-code file not created: {gcode_path}")
+                    produced = gcode_files[0]
+                produced.replace(gcode_path)
             
             file_size = gcode_path.stat().st_size
             logger.info(f"✅ Sliced {stl_path.name} -> {gcode_path.name} ({file_size / 1024:.1f} KB)")
+            await asyncio.to_thread(self._store_in_gcode_cache, cache_key, gcode_path)
             
             return gcode_path
             
@@ -531,38 +679,3 @@ class OrcaSlicer(BaseSlicer):
         except Exception as e:
             logger.exception(f"Unexpected error during slicing: {e}")
             raise RuntimeError(f"Slicing failed: {e}")
-
-    async def slice_files(self, stl_paths: List[Path], output_dir: Path) -> List[Path]:
-        """
-        Slice multiple STL files to G-code.
-
-        Args:
-            stl_paths: List of paths to STL files
-            output_dir: Directory where G-code files should be saved
-
-        Returns:
-            List of paths to generated G-code files
-
-        Raises:
-            RuntimeError: If any slicing operation fails
-        """
-        logger.info(f"Starting batch slicing of {len(stl_paths)} file(s)...")
-        
-        gcode_paths = []
-        errors = []
-        
-        for stl_path in stl_paths:
-            try:
-                gcode_path = await self.slice_file(stl_path, output_dir)
-                gcode_paths.append(gcode_path)
-            except Exception as e:
-                logger.error(f"Failed to slice {stl_path.name}: {e}")
-                errors.append((stl_path.name, str(e)))
-        if errors:
-            error_summary = "\n".join([f"  • {name}: {err}" for name, err in errors])
-            raise RuntimeError(
-                f"Failed to slice {len(errors)}/{len(stl_paths)} file(s):\n{error_summary}"
-            )
-        
-        logger.info(f"✅ Successfully sliced {len(gcode_paths)} file(s)")
-        return gcode_paths
@@ -0,0 +1,26 @@
+"""Shared fakes for intent parser tests."""
+import asyncio
+
+from src.intent.parser import IntentParser
+from src.llm.base import LLMProvider
+
+
+class CountingLLM(LLMProvider):
+    """Fake provider that returns a fixed JSON reply and counts calls."""
+
+    def __init__(self, reply: str = '{"intent": "info", "confidence": 0.8}'):
+        self.reply = reply
+        self.calls = 0
+
+    async def chat(self, messages, **kwargs) -> str:
+        self.calls += 1
+        return self.reply
+
+
+def parse_all(parser: IntentParser, *messages: str) -> list[dict]:
+    """Parse messages one after another on a fresh event loop and return the results."""
+
+    async def run():
+        return [await parser.parse(message) for message in messages]
+
+    return asyncio.run(run())
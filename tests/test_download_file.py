@@ -0,0 +1,38 @@
+"""Test that download_file batches disk writes instead of hopping threads per chunk."""
+import asyncio
+import tempfile
+from pathlib import Path
+
+import httpx
+
+from src.downloads import fetcher
+from src.downloads.fetcher import DOWNLOAD_CHUNK_SIZE, DOWNLOAD_WRITE_BUFFER_SIZE, download_file
+
+PAYLOAD = bytes(range(256)) * (4 * DOWNLOAD_WRITE_BUFFER_SIZE // 256 + 300)  # 4 MiB and a tail
+
+
+def test_download_writes_are_buffered(monkeypatch):
+    """A 4 MiB body in 64 KiB chunks reaches disk intact in a handful of worker writes."""
+    hops = []
+    to_thread = asyncio.to_thread
+
+    async def counting_to_thread(func, *args, **kwargs):
+        hops.append(getattr(func, "__name__", repr(func)))
+        return await to_thread(func, *args, **kwargs)
+
+    monkeypatch.setattr(fetcher.asyncio, "to_thread", counting_to_thread)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=PAYLOAD))
+
+    async def run(dest: Path) -> None:
+        async with httpx.AsyncClient(transport=transport) as client:
+            await download_file(client, "https://files.printables.com/a.stl", dest)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dest = Path(tmpdir) / "a.stl"
+        asyncio.run(run(dest))
+
+        assert dest.read_bytes() == PAYLOAD
+    chunks = -(-len(PAYLOAD) // DOWNLOAD_CHUNK_SIZE)
+    writes = hops.count("write")
+    assert writes == -(-len(PAYLOAD) // DOWNLOAD_WRITE_BUFFER_SIZE)
+    assert writes < chunks // 10
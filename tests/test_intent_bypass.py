@@ -0,0 +1,27 @@
+"""Test that unambiguous messages are classified without calling the LLM."""
+from llm_fakes import CountingLLM, parse_all
+
+from src.intent.parser import IntentParser
+
+MODEL_URL = "https://www.printables.com/model/285921-wifi-climate-sensor"
+
+
+def test_greeting_and_bare_link_skip_llm():
+    """Greetings are unclear, a lone supported link (optionally with "print") is print."""
+    llm = CountingLLM()
+    greeting, bare, with_print = parse_all(
+        IntentParser(llm_provider=llm), "Hello!", MODEL_URL, f"print this: {MODEL_URL}"
+    )
+
+    assert llm.calls == 0
+    assert greeting["intent"] == "unclear" and greeting["confidence"] == 1.0
+    assert bare["intent"] == "print" and bare["url"] == MODEL_URL and bare["site"] == "printables"
+    assert with_print["intent"] == "print"
+
+
+def test_other_messages_and_opt_out_use_llm():
+    """Anything beyond the simple forms, or a parser with the bypass disabled, asks the LLM."""
+    llm = CountingLLM()
+    parse_all(IntentParser(llm_provider=llm), f"what is {MODEL_URL}")
+    parse_all(IntentParser(llm_provider=llm, allow_heuristic_bypass=False), MODEL_URL)
+    assert llm.calls == 2
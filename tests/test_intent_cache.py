@@ -0,0 +1,24 @@
+"""Test that repeated messages reuse the parsed intent instead of calling the LLM again."""
+from llm_fakes import CountingLLM, parse_all
+
+from src.intent.parser import IntentParser
+
+
+def test_repeated_message_hits_cache():
+    """Messages differing only in case and whitespace share one LLM call."""
+    llm = CountingLLM('{"intent": "print", "confidence": 0.9}')
+    parser = IntentParser(llm_provider=llm)
+
+    (first,) = parse_all(parser, "could you make this one https://www.printables.com/model/1")
+    first["intent"] = "mutated"  # callers get a copy, not the cached dict
+    (second,) = parse_all(parser, "  Could you MAKE this   one https://www.printables.com/model/1 ")
+
+    assert llm.calls == 1
+    assert second["intent"] == "print"
+
+
+def test_unclear_result_not_cached():
+    """Unclear answers are asked again rather than pinned in the cache."""
+    llm = CountingLLM('{"intent": "unclear", "confidence": 0.9}')
+    parse_all(IntentParser(llm_provider=llm), "hmm", "hmm")
+    assert llm.calls == 2
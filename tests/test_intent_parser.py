@@ -1,14 +1,17 @@
 """Example script to test the Intent Parser."""
-import json
+import asyncio
 import logging
 import sys
 from pathlib import Path
+
+import orjson
 import pytest
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from src.intent.parser import IntentParser
+from src.llm import close_shared_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -31,16 +34,21 @@ async def test_intent_parser():
 
         print("Testing Intent Parser\n" + "=" * 60)
 
-        for i, message in enumerate(test_cases, 1):
+        # Submit all messages at once so the LLM backend can batch them
+        results = await asyncio.gather(
+            *(parser.parse(message) for message in test_cases), return_exceptions=True
+        )
+        # The Ollama HTTP client is app-owned; close it here as bot shutdown would
+        await close_shared_client()
+
+        for i, (message, intent) in enumerate(zip(test_cases, results), 1):
             print(f"\n[{i}] Message: {message}")
             print("-" * 60)
-            try:
-                intent = await parser.parse(message)
-                print(json.dumps(intent, indent=2))
-                # Basic assertions
-                assert "intent" in intent
-                assert "confidence" in intent
-            except Exception as e:
-                print(f"ERROR: {e}")
-                raise
+            if isinstance(intent, Exception):
+                print(f"ERROR: {intent}")
+                raise intent
+            print(orjson.dumps(intent, option=orjson.OPT_INDENT_2).decode())
+            # Basic assertions
+            assert "intent" in intent
+            assert "confidence" in intent
 
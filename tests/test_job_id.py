@@ -5,7 +5,7 @@ from pathlib import Path
 import tempfile
 import shutil
 
-from src.downloads.fetcher import _generate_job_id
+from src.downloads.fetcher import JOB_COUNTERS_DIRNAME, _generate_job_id
 
 
 def test_job_id_format():
@@ -70,3 +70,31 @@ def test_different_users():
         (jobs_dir / job_id1_2).mkdir(parents=True)
         
         assert f"-{user1}-002" in job_id1_2
+
+
+def test_continues_after_existing_jobs():
+    """Jobs created before the counter file existed are not reused."""
+    user_id = 333333
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jobs_dir = Path(tmpdir)
+        today = datetime.now().strftime("%Y.%m.%d")
+        (jobs_dir / f"{today}-{user_id}-007").mkdir(parents=True)
+
+        assert _generate_job_id(user_id, jobs_dir).endswith("-008")
+        # Later IDs come from the counter, not from the directories on disk
+        assert _generate_job_id(user_id, jobs_dir).endswith("-009")
+
+
+def test_old_day_counters_are_pruned():
+    """Seeding a new counter removes counter files left over from previous days."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jobs_dir = Path(tmpdir)
+        counters_dir = jobs_dir / JOB_COUNTERS_DIRNAME
+        counters_dir.mkdir()
+        (counters_dir / "2000.01.01-123456").write_text("7")
+
+        _generate_job_id(123456, jobs_dir)
+
+        today = datetime.now().strftime("%Y.%m.%d")
+        assert [p.name for p in counters_dir.iterdir()] == [f"{today}-123456"]
@@ -6,15 +6,18 @@ Ensure Ollama is running (e.g. ollama serve) and a model is pulled (e.g. ollama
 Exits with 0 on pass, 1 on failure.
 """
 import asyncio
-import json
 import logging
+import re
 import sys
 from pathlib import Path
 
+import orjson
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from src.intent.parser import IntentParser
+from src.llm import close_shared_client
 
 # Show INFO logs from the intent parser and LLM
 logging.basicConfig(
@@ -30,20 +33,22 @@ CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
 SUPPORTED_DOMAINS_JSON = CONFIG_DIR / "supported_domains.json"
 
 
-def _load_supported_from_config() -> tuple[list[str], set[str]]:
+def _load_supported_from_config() -> tuple[list[str], frozenset[str]]:
     """Load config/supported_domains.json; return (list of domains, set of site names)."""
     if not SUPPORTED_DOMAINS_JSON.exists():
         raise FileNotFoundError(f"Config not found: {SUPPORTED_DOMAINS_JSON}")
-    domains = json.loads(SUPPORTED_DOMAINS_JSON.read_text(encoding="utf-8"))
+    domains = orjson.loads(SUPPORTED_DOMAINS_JSON.read_bytes())
     if not isinstance(domains, list) or not all(isinstance(d, str) for d in domains):
         raise ValueError("supported_domains.json must be a list of strings")
     domains = [d.lower().strip() for d in domains if d and not d.startswith("www.")]
     # Site name = first label (e.g. printables.com -> printables)
-    sites = {d.split(".", 1)[0] for d in domains}
+    sites = frozenset(d.split(".", 1)[0] for d in domains)
     return domains, sites
 
 
 SUPPORTED_DOMAINS, SUPPORTED_SITES = _load_supported_from_config()
+# One scan per URL instead of a Python-level loop over domains; (?!) never matches
+SUPPORTED_DOMAINS_RE = re.compile("|".join(re.escape(d) for d in SUPPORTED_DOMAINS) or "(?!)")
 
 
 def _sample_url_for_print_test() -> str:
@@ -98,7 +103,7 @@ def check_print_link(intent: dict, message: str) -> list[str]:
     if not url or not isinstance(url, str):
         errors.append("expected non-empty 'url' for print link message")
     else:
-        if not any(d in url for d in SUPPORTED_DOMAINS):
+        if not SUPPORTED_DOMAINS_RE.search(url):
             errors.append(f"url must be from supported site ({SUPPORTED_DOMAINS}), got {url!r}")
     site = intent.get("site")
     if site not in SUPPORTED_SITES:
@@ -106,19 +111,17 @@ def check_print_link(intent: dict, message: str) -> list[str]:
     return errors
 
 
-async def run_test(parser: IntentParser, name: str, message: str, check_fn) -> tuple[bool, dict]:
-    """Run one test; return (passed, intent_result)."""
-    try:
-        intent = await parser.parse(message)
-    except Exception as e:
-        print(f"  FAILED: parser raised {e}")
+def check_result(intent: dict | BaseException, message: str, check_fn) -> tuple[bool, dict]:
+    """Check one parse result (or the exception it raised); return (passed, intent_result)."""
+    if isinstance(intent, BaseException):
+        print(f"  FAILED: parser raised {intent}")
         return False, {}
     failures = check_fn(intent, message)
     if failures:
         print(f"  FAILED: {'; '.join(failures)}")
-        print("  Result:", json.dumps(intent, indent=2))
+        print("  Result:", orjson.dumps(intent, option=orjson.OPT_INDENT_2).decode())
         return False, intent
-    print("  Result:", json.dumps(intent, indent=2))
+    print("  Result:", orjson.dumps(intent, option=orjson.OPT_INDENT_2).decode())
     return True, intent
 
 
@@ -126,9 +129,19 @@ async def main() -> int:
     print("Testing intent parser with LLM...\n")
     
     async with IntentParser() as parser:
+        message_with_link = f"print {_sample_url_for_print_test()}"
+        # Send both messages to the LLM together; results are checked in order below
+        intent1, intent2 = await asyncio.gather(
+            parser.parse("hello"),
+            parser.parse(message_with_link),
+            return_exceptions=True,
+        )
+        # The Ollama HTTP client is app-owned; close it here as bot shutdown would
+        await close_shared_client()
+
         # Test 1: "hello" -> unclear
         print("[1] Message: 'hello' (expect intent=unclear)")
-        passed1, _ = await run_test(parser, "hello", "hello", check_hello)
+        passed1, _ = check_result(intent1, "hello", check_hello)
         if not passed1:
             print("\nOverall: FAILED (hello test)")
             return 1
@@ -136,9 +149,8 @@ async def main() -> int:
 
         # Test 2: "print <link>" -> print + supported URL/site (link from config)
         print("[2] Message: 'print <link to supported website>'")
-        message_with_link = f"print {_sample_url_for_print_test()}"
         print(f"  Input: {message_with_link!r}")
-        passed2, _ = await run_test(parser, "print_link", message_with_link, check_print_link)
+        passed2, _ = check_result(intent2, message_with_link, check_print_link)
         if not passed2:
             print("\nOverall: FAILED (print link test)")
             return 1
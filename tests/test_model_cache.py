@@ -0,0 +1,107 @@
+"""Test the URL -> downloaded files cache used to skip repeat downloads."""
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import tempfile
+import time
+
+import orjson
+
+from src.downloads.fetcher import (
+    _load_url_cache,
+    _remember_model_files,
+    get_cached_model_files,
+    reuse_cached_model_files,
+)
+
+MODEL_URL = "https://www.printables.com/model/285921-wifi-climate-sensor"
+
+
+def _make_job(jobs_dir: Path, job_id: str) -> list[Path]:
+    job_dir = jobs_dir / job_id
+    job_dir.mkdir(parents=True)
+    stl = job_dir / "case.stl"
+    stl.write_bytes(b"solid case\nendsolid case\n")
+    return [stl]
+
+
+def test_cache_hit_for_equivalent_url():
+    """A cached model is found again via a different link to the same model."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jobs_dir = Path(tmpdir)
+        stl_paths = _make_job(jobs_dir, "2026.02.16-123456-001")
+        _remember_model_files(MODEL_URL, "2026.02.16-123456-001", stl_paths, jobs_dir)
+
+        cached = get_cached_model_files("https://printables.com/model/285921/files", jobs_dir=jobs_dir)
+        assert cached == ("2026.02.16-123456-001", stl_paths)
+
+
+def test_cache_miss_when_expired_or_files_missing():
+    """Stale entries and entries whose files were deleted are ignored."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jobs_dir = Path(tmpdir)
+        stl_paths = _make_job(jobs_dir, "2026.02.16-123456-001")
+        _remember_model_files(MODEL_URL, "2026.02.16-123456-001", stl_paths, jobs_dir)
+
+        assert get_cached_model_files(MODEL_URL, jobs_dir=jobs_dir, max_age=-1) is None
+
+        stl_paths[0].unlink()
+        assert get_cached_model_files(MODEL_URL, jobs_dir=jobs_dir) is None
+
+
+def test_reuse_gives_requester_own_job():
+    """A cache hit from another user's download is linked into a fresh job for the requester."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jobs_dir = Path(tmpdir)
+        stl_paths = _make_job(jobs_dir, "2026.02.16-111111-001")
+        _remember_model_files(MODEL_URL, "2026.02.16-111111-001", stl_paths, jobs_dir)
+
+        job_id, reused = reuse_cached_model_files(MODEL_URL, user_id=222222, jobs_dir=jobs_dir)
+        assert "-222222-" in job_id
+        assert reused == [jobs_dir / job_id / "case.stl"]
+        assert reused[0].read_bytes() == stl_paths[0].read_bytes()
+
+
+def test_concurrent_writes_keep_every_entry():
+    """Writers run in worker threads; none of their entries may be lost."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jobs_dir = Path(tmpdir)
+        for i in range(40):
+            (jobs_dir / f"job-{i}").mkdir()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for i in range(40):
+                pool.submit(
+                    _remember_model_files, f"https://www.printables.com/model/{i}", f"job-{i}", [Path("a.stl")], jobs_dir
+                )
+
+        assert len(_load_url_cache(jobs_dir)) == 40
+        assert not list(jobs_dir.glob("*.tmp"))
+
+
+def test_writes_prune_stale_entries():
+    """Expired entries and entries whose job directory is gone are dropped from the index."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jobs_dir = Path(tmpdir)
+        index = {
+            "old": {"job_id": "old-job", "files": ["a.stl"], "fetched_at": 0},
+            "gone": {"job_id": "gone-job", "files": ["a.stl"], "fetched_at": time.time()},
+            "corrupt": {"job_id": "kept-job", "files": ["a.stl"], "fetched_at": "yesterday"},
+        }
+        (jobs_dir / "old-job").mkdir()
+        (jobs_dir / "kept-job").mkdir()
+        (jobs_dir / ".url_cache.json").write_bytes(orjson.dumps(index))
+
+        stl_paths = _make_job(jobs_dir, "2026.02.16-123456-001")
+        _remember_model_files(MODEL_URL, "2026.02.16-123456-001", stl_paths, jobs_dir)
+
+        assert list(_load_url_cache(jobs_dir)) == ["printables:285921"]
+
+
+def test_corrupt_entry_is_a_miss():
+    """An entry with an unparsable timestamp reads as a cache miss, not an error."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jobs_dir = Path(tmpdir)
+        _make_job(jobs_dir, "job")
+        for fetched_at in ("yesterday", None, [1]):
+            index = {"printables:285921": {"job_id": "job", "files": ["case.stl"], "fetched_at": fetched_at}}
+            (jobs_dir / ".url_cache.json").write_bytes(orjson.dumps(index))
+            assert get_cached_model_files(MODEL_URL, jobs_dir=jobs_dir) is None
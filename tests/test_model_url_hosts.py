@@ -0,0 +1,33 @@
+"""Test that model URLs are dispatched on their real host, not on a substring of the URL."""
+import asyncio
+
+import pytest
+
+from src.downloads.fetcher import _PRINTABLES_HOSTS, _host_in, fetch_model_files
+
+
+def test_host_in_accepts_exact_host_and_subdomains_only():
+    """Exact hosts and their subdomains match; hosts that merely contain the name do not."""
+    assert _host_in("printables.com", _PRINTABLES_HOSTS)
+    assert _host_in("www.printables.com", _PRINTABLES_HOSTS)
+    assert _host_in("media.printables.com", _PRINTABLES_HOSTS)
+    assert not _host_in("printables.com.evil.tld", _PRINTABLES_HOSTS)
+    assert not _host_in("evilprintables.com", _PRINTABLES_HOSTS)
+
+
+def test_supported_hosts_are_dispatched():
+    """Thingiverse is recognized (and reported as not implemented) without any network call."""
+    for url in ["https://thingiverse.com/thing:1", "https://www.thingiverse.com/thing:1"]:
+        with pytest.raises(NotImplementedError):
+            asyncio.run(fetch_model_files(url))
+
+
+def test_look_alike_hosts_are_rejected():
+    """Supported domains elsewhere in the URL (suffix, userinfo, path) do not count."""
+    for url in [
+        "https://printables.com.evil.tld/model/1",
+        "https://printables.com@evil.com/model/1",
+        "https://evil.com/printables.com/model/1",
+    ]:
+        with pytest.raises(ValueError, match="Unsupported model URL"):
+            asyncio.run(fetch_model_files(url))
@@ -0,0 +1,21 @@
+"""Test extraction of the STL list embedded in a Printables /files page."""
+from src.downloads.fetcher import _parse_printables_stls_from_html
+
+
+def test_parses_escaped_stls_array():
+    """The escaped stls array is decoded and trailing page content is ignored."""
+    html = (
+        '<script>self.__next_f.push([1,"{\\"model\\":{\\"stls\\":['
+        '{\\"name\\":\\"case [top].stl\\",\\"filePreviewPath\\":\\"media\\/prints\\/1\\/case_preview.png\\"},'
+        '{\\"name\\":\\"lid.stl\\",\\"filePreviewPath\\":\\"\\"}'
+        '],\\"gcodes\\":[]}}"])</script>'
+    )
+    stls = _parse_printables_stls_from_html(html)
+    assert [s["name"] for s in stls] == ["case [top].stl", "lid.stl"]
+    assert stls[0]["filePreviewPath"] == "media/prints/1/case_preview.png"
+
+
+def test_missing_or_broken_array_returns_empty():
+    """Pages without the key, or with a truncated array, yield no files."""
+    assert _parse_printables_stls_from_html("<html></html>") == []
+    assert _parse_printables_stls_from_html('{\\"stls\\":[{\\"name\\":') == []
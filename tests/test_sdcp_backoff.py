@@ -0,0 +1,62 @@
+"""Test SdcpClient.connect_with_backoff retry count, delays and cleanup (no printer needed)."""
+import asyncio
+
+import pytest
+
+sdcp_client = pytest.importorskip("src.printerConnector.sdcp_client")
+SdcpClient = sdcp_client.SdcpClient
+
+
+class FlakyClient(SdcpClient):
+    """Fails to connect a fixed number of times, recording close() calls."""
+
+    def __init__(self, failures: int):
+        super().__init__(printer_ip="192.0.2.1")
+        self.failures = failures
+        self.attempts = 0
+        self.closes = 0
+
+    async def connect(self):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise OSError("connection refused")
+        return "printer"
+
+    async def close(self) -> None:
+        self.closes += 1
+
+
+def _run_recording_sleeps(monkeypatch, coro) -> tuple[list[float], object]:
+    delays: list[float] = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(sdcp_client.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(sdcp_client.random, "random", lambda: 0.5)
+    return delays, asyncio.run(coro)
+
+
+def test_retries_with_growing_delays(monkeypatch):
+    """Jittered first wait, then MIN growing by FACTOR; every failed attempt is cleaned up."""
+    client = FlakyClient(failures=3)
+    delays, printer = _run_recording_sleeps(monkeypatch, client.connect_with_backoff())
+
+    assert printer == "printer"
+    assert client.attempts == 4
+    assert client.closes == 3
+    assert delays == pytest.approx([
+        0.5 * sdcp_client.RECONNECT_BACKOFF_INITIAL,
+        sdcp_client.RECONNECT_BACKOFF_MIN,
+        sdcp_client.RECONNECT_BACKOFF_MIN * sdcp_client.RECONNECT_BACKOFF_FACTOR,
+    ])
+
+
+def test_gives_up_after_max_attempts_and_closes(monkeypatch):
+    """The last error is raised, after the half-open connection is closed."""
+    client = FlakyClient(failures=10)
+    with pytest.raises(OSError):
+        _run_recording_sleeps(monkeypatch, client.connect_with_backoff(max_attempts=2))
+
+    assert client.attempts == 2
+    assert client.closes == 2
@@ -0,0 +1,109 @@
+"""Test that BaseSlicer.slice_files runs slices concurrently and keeps input order."""
+import asyncio
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.slicer.base import BaseSlicer
+
+
+class SleepySlicer(BaseSlicer):
+    """Fake slicer that records how many slices overlap."""
+
+    max_concurrent_slices = 2
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+
+    async def slice_file(self, stl_path: Path, output_dir: Path) -> Path:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        # Later files finish first, so order must come from the input list
+        await asyncio.sleep(0.01 * (4 - int(stl_path.stem)))
+        self.running -= 1
+        return output_dir / f"{stl_path.stem}.gcode"
+
+
+def test_slice_files_bounded_and_ordered():
+    slicer = SleepySlicer()
+    stl_paths = [Path(f"{i}.stl") for i in range(4)]
+
+    result = asyncio.run(slicer.slice_files(stl_paths, Path("out")))
+
+    assert [p.name for p in result] == ["0.gcode", "1.gcode", "2.gcode", "3.gcode"]
+    assert slicer.peak == 2
+
+
+class Interrupted(BaseException):
+    """Stands in for BaseExceptions that are not slicing failures."""
+
+
+class InterruptedSlicer(BaseSlicer):
+    """Fake slicer whose run is interrupted rather than failing."""
+
+    async def slice_file(self, stl_path: Path, output_dir: Path) -> Path:
+        raise Interrupted
+
+
+def test_slice_files_reraises_non_exception_errors():
+    """BaseExceptions are propagated, never reported as failures or returned as paths."""
+    with pytest.raises(Interrupted):
+        asyncio.run(InterruptedSlicer().slice_files([Path("0.stl")], Path("out")))
+
+
+FAKE_ORCA = """#!{python}
+import json, sys, time
+from pathlib import Path
+args = sys.argv[1:]
+out = Path(args[args.index("--outputdir") + 1])
+settings = args[args.index("--load-settings") + 1].split(";") + [args[args.index("--load-filaments") + 1]]
+for _ in range(20):  # keep reading while the sibling slice prepares its presets
+    for path in settings:
+        json.loads(Path(path).read_text())
+    time.sleep(0.005)
+(out / (Path(args[-1]).stem + ".gcode")).write_text("G28\\n")
+"""
+
+
+def test_concurrent_orca_slices_share_one_preset_build():
+    """Presets are prepared once per batch and never seen half-written by a running slice."""
+    from src.slicer.orca_slicer import OrcaSlicer
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        preset = root / "preset"
+        for kind in ("printer", "filament", "process"):
+            (preset / kind).mkdir(parents=True)
+            (preset / kind / f"{kind}.json").write_text(json.dumps({"name": kind}))
+        orca = root / "orca"
+        orca.write_text(FAKE_ORCA.format(python=sys.executable))
+        orca.chmod(0o755)
+        stl_paths = []
+        for name in ("a", "b"):
+            stl = root / f"{name}.stl"
+            stl.write_text(f"solid {name}\n")
+            stl_paths.append(stl)
+
+        slicer = OrcaSlicer(preset_path=preset, orca_bin_path=str(orca))
+        slicer.max_concurrent_slices = 2
+        slicer._cli_cache_dir = root / "cli_cache"
+        slicer._cli_cache_dir.mkdir()
+        slicer._gcode_cache_dir = root / "gcode_cache"
+        builds = []
+        build = slicer._build_preset_args
+        slicer._build_preset_args = lambda: builds.append(1) or build()
+
+        result = asyncio.run(slicer.slice_files(stl_paths, root / "out"))
+
+        assert [p.name for p in result] == ["a.gcode", "b.gcode"]
+        assert len(builds) == 1
+        assert not list(slicer._cli_cache_dir.glob("*.tmp"))
+
+        # Unchanged presets are not rewritten on the next batch
+        written = {p: p.stat().st_mtime_ns for p in slicer._cli_cache_dir.iterdir()}
+        asyncio.run(slicer.slice_files(stl_paths, root / "out"))
+        assert {p: p.stat().st_mtime_ns for p in slicer._cli_cache_dir.iterdir()} == written